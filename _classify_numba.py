@@ -0,0 +1,203 @@
+"""
+Compiled Gesture Classifier
+Rule-based hand pose classifier compiled with Numba.
+
+classify() operates on a float32 (21, 2) array of normalized MediaPipe
+landmark coordinates and returns an integer gesture id (see _gestures.py).
+Motion-based gestures such as wave are decided by the caller; wave_counts()
+does the per-frame counting for it.
+
+Author: Gesture Recognition Team Member
+For: BigRedHacks MVP
+"""
+
+import numpy as np
+
+from _gestures import (
+    CALL,
+    FIST,
+    FOUR_FINGERS,
+    L_SHAPE,
+    MIDDLE_FINGER,
+    NO_GESTURE,
+    OK,
+    OPEN_PALM,
+    PEACE,
+    PINKY,
+    POINTING,
+    RING_FINGER,
+    ROCK,
+    THREE_FINGERS,
+    THREE_FINGERS_SERBIAN_STYLE,
+    THUMBS_DOWN,
+    THUMBS_UP,
+    TWO_FINGERS_IR,
+    TWO_FINGERS_MR,
+)
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; run the same code as plain Python
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Landmark indices of the index, middle, ring and pinky joints
+FINGER_TIPS = np.array([8, 12, 16, 20])
+FINGER_PIPS = np.array([6, 10, 14, 18])
+FINGER_MCPS = np.array([5, 9, 13, 17])
+
+# Rule thresholds, in normalized image coordinates. Numba freezes module
+# globals into the compiled code as constants, so rebuild (or restart, for the
+# JIT) after changing them; distances are compared squared.
+THUMB_EXTENSION_RATIO_SQ = 1.96  # Thumb tip 1.4x as far from the wrist as the MCP
+THUMB_MIN_DY = 0.02  # Thumb tip must be this far above or below its MCP
+THUMBS_UP_DY = 0.03  # Thumb tip above the other fingertips by this much
+THUMBS_DOWN_DY = 0.02  # Thumb tip below the other fingertips by this much
+THUMBS_DOWN_WRIST_DY = 0.03  # ...or below the wrist by this much
+OK_DISTANCE_SQ = 0.05 * 0.05  # Thumb and index tips touching
+
+# Table entries that need a geometric check on top of the finger mask
+_THUMB_ONLY = -2  # thumbs_up, thumbs_down or fist depending on thumb height
+_OK_CANDIDATE = -3  # ok if the thumb and index tips touch
+
+# Gesture id for every finger mask; bit 0 is the thumb, bit 4 the pinky
+MASK_TO_GESTURE = np.array(
+    [
+        FIST,  # 00000
+        _THUMB_ONLY,  # 00001
+        POINTING,  # 00010
+        L_SHAPE,  # 00011
+        MIDDLE_FINGER,  # 00100
+        MIDDLE_FINGER,  # 00101
+        PEACE,  # 00110
+        THREE_FINGERS_SERBIAN_STYLE,  # 00111
+        RING_FINGER,  # 01000
+        RING_FINGER,  # 01001
+        TWO_FINGERS_IR,  # 01010
+        TWO_FINGERS_IR,  # 01011
+        TWO_FINGERS_MR,  # 01100
+        TWO_FINGERS_MR,  # 01101
+        THREE_FINGERS,  # 01110
+        THREE_FINGERS,  # 01111
+        PINKY,  # 10000
+        CALL,  # 10001
+        ROCK,  # 10010
+        ROCK,  # 10011
+        NO_GESTURE,  # 10100
+        NO_GESTURE,  # 10101
+        NO_GESTURE,  # 10110
+        NO_GESTURE,  # 10111
+        NO_GESTURE,  # 11000
+        NO_GESTURE,  # 11001
+        NO_GESTURE,  # 11010
+        NO_GESTURE,  # 11011
+        _OK_CANDIDATE,  # 11100
+        _OK_CANDIDATE,  # 11101
+        FOUR_FINGERS,  # 11110
+        OPEN_PALM,  # 11111
+    ],
+    dtype=np.int32,
+)
+
+
+
+@njit(cache=True, fastmath=True)
+def _d2(pts, a, b):
+    """Squared distance between landmarks a and b."""
+    dx = pts[a, 0] - pts[b, 0]
+    dy = pts[a, 1] - pts[b, 1]
+    return dx * dx + dy * dy
+
+
+# Eager signature: compiled (or loaded from cache) at import, not on the first
+# frame. pts must be a C-contiguous float32 (21, 2) array.
+@njit("int32(float32[:, ::1])", cache=True, fastmath=True)
+def classify(pts):
+    """
+    Classify a static hand pose.
+
+    Args:
+        pts: float32 array of shape (21, 2) with normalized (x, y) landmarks
+
+    Returns:
+        Gesture id, or NO_GESTURE if the pose is not recognized
+    """
+    wrist_y = pts[0, 1]
+    thumb_tip_y = pts[4, 1]
+    thumb_mcp_y = pts[2, 1]
+
+    # Thumb: far enough from the wrist and pointing clearly up or down
+    thumb = _d2(pts, 4, 0) > _d2(pts, 2, 0) * THUMB_EXTENSION_RATIO_SQ and (
+        thumb_tip_y < thumb_mcp_y - THUMB_MIN_DY
+        or thumb_tip_y > thumb_mcp_y + THUMB_MIN_DY
+    )
+
+    # Other fingers, all four at once: tip above PIP and PIP above MCP
+    y = pts[:, 1]
+    pip_y = y[FINGER_PIPS]
+    extended = (y[FINGER_TIPS] < pip_y) & (pip_y < y[FINGER_MCPS])
+    mask = (
+        int(thumb)
+        | int(extended[0]) << 1
+        | int(extended[1]) << 2
+        | int(extended[2]) << 3
+        | int(extended[3]) << 4
+    )
+    gesture_id = MASK_TO_GESTURE[mask]
+
+    if gesture_id == _THUMB_ONLY:
+        # Only the thumb is extended: up, down, or a loose fist
+        avg_other_y = (pts[8, 1] + pts[12, 1] + pts[16, 1] + pts[20, 1]) / 4.0
+        if thumb_tip_y < avg_other_y - THUMBS_UP_DY:
+            return THUMBS_UP
+        elif thumb_tip_y > avg_other_y + THUMBS_DOWN_DY:
+            return THUMBS_DOWN
+        elif thumb_tip_y > wrist_y + THUMBS_DOWN_WRIST_DY:
+            return THUMBS_DOWN
+        return FIST
+    elif gesture_id == _OK_CANDIDATE:
+        # OK sign: thumb and index tips close together
+        if _d2(pts, 4, 8) < OK_DISTANCE_SQ:
+            return OK
+        return NO_GESTURE
+
+    return gesture_id
+
+
+@njit("UniTuple(int64, 2)(float32[::1], int64, float32)", cache=True)
+def wave_counts(xs, start, threshold):
+    """
+    Count wrist movements in a ring buffer of x positions.
+
+    Args:
+        xs: float32 ring buffer of wrist x positions
+        start: Index of the oldest position in xs
+        threshold: Minimum movement between two positions to be significant
+
+    Returns:
+        Tuple of (significant_movements, direction_changes). The first
+        movement is not counted, and a direction change needs significant
+        movements on both sides.
+    """
+    n = xs.shape[0]
+    significant_movements = 0
+    direction_changes = 0
+    prev_x = xs[(start + 1) % n]
+    prev_move = prev_x - xs[start]
+    prev_significant = abs(prev_move) > threshold
+    for k in range(2, n):
+        x = xs[(start + k) % n]
+        move = x - prev_x
+        significant = abs(move) > threshold
+        if significant:
+            significant_movements += 1
+            if prev_significant and move * prev_move < 0:
+                direction_changes += 1
+        prev_x = x
+        prev_move = move
+        prev_significant = significant
+    return significant_movements, direction_changes
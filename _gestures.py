@@ -0,0 +1,59 @@
+"""
+Gesture Ids
+Gesture ids, names and the wave threshold shared by the classifier kernels
+and their callers.
+
+Kept free of numba so that code which only needs the names (or uses the
+ahead-of-time gesture_kernels build) does not load the JIT kernels in
+_classify_numba.py. The ids are frozen into the compiled kernels, so rebuild
+gesture_kernels after changing them.
+
+Author: Gesture Recognition Team Member
+For: BigRedHacks MVP
+"""
+
+# Gesture ids returned by classify(); index into GESTURE_NAMES
+NO_GESTURE = -1
+FIST = 0
+THUMBS_UP = 1
+THUMBS_DOWN = 2
+OPEN_PALM = 3
+PEACE = 4
+CALL = 5
+L_SHAPE = 6
+POINTING = 7
+ROCK = 8
+THREE_FINGERS = 9
+THREE_FINGERS_SERBIAN_STYLE = 10
+MIDDLE_FINGER = 11
+RING_FINGER = 12
+PINKY = 13
+TWO_FINGERS_IR = 14
+TWO_FINGERS_MR = 15
+FOUR_FINGERS = 16
+OK = 17
+
+GESTURE_NAMES = (
+    "fist",
+    "thumbs_up",
+    "thumbs_down",
+    "open_palm",
+    "peace",
+    "call",
+    "l_shape",
+    "pointing",
+    "rock",
+    "three_fingers",
+    "three_fingers_serbian_style",
+    "middle_finger",
+    "ring_finger",
+    "pinky",
+    "two_fingers_ir",
+    "two_fingers_mr",
+    "four_fingers",
+    "ok",
+)
+
+# Minimum wrist movement between frames for a wave, in normalized image
+# coordinates; passed to wave_counts() at runtime rather than frozen into it
+WAVE_THRESHOLD = 0.05
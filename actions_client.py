@@ -7,27 +7,81 @@ For: BigRedHacks MVP
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import time
 import logging
-from typing import Optional, Dict, Any
+import queue
+import random
+import threading
+from typing import Optional, Dict, Any, List
 from datetime import datetime
 
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _json_loads = json.loads
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Outgoing gesture queue settings
+SEND_QUEUE_SIZE = 256  # Gestures buffered before new ones are dropped
+MAX_BATCH_SIZE = 32  # Gestures coalesced into a single request
+_STOP = None  # Sentinel telling the flush thread to exit
+
+# Shared by every gesture POST; requests does not mutate the headers dict
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def create_session(pool_maxsize: int = 32) -> requests.Session:
+    """
+    Create a keep-alive HTTP session backed by a connection pool.
+
+    Pass the same session to ActionsClient and CameraStreamer so gesture and
+    frame traffic to the server share one pool of connections.
+
+    Args:
+        pool_maxsize: Maximum connections kept open per host
+
+    Returns:
+        Configured requests session
+    """
+    session = requests.Session()
+    # The action server is local; skip the per-request proxy/netrc lookups
+    session.trust_env = False
+    session.mount(
+        "http://",
+        HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize, max_retries=0),
+    )
+    return session
+
 
 class ActionsClient:
     """
     Client for sending gesture detection results to the action execution server.
-    Supports both HTTP API and WebSocket communication.
+    Sends over HTTP with a keep-alive session and a background flush thread.
     """
 
     def __init__(
         self,
         server_url: str = "http://localhost:3001",
         timeout: float = 5.0,
+        send_timeout: float = 1.0,
+        max_retries: int = 3,
+        base_delay: float = 0.1,
+        jitter: float = 0.5,
+        max_delay: float = 1.0,
+        dedupe_window: float = 0.2,
+        session: Optional[requests.Session] = None,
     ):
         """
         Initialize the actions client.
@@ -35,14 +89,54 @@ class ActionsClient:
         Args:
             server_url: Base URL of the action server
             timeout: Request timeout in seconds
+            send_timeout: Request timeout for gesture posts in seconds; kept
+                short because a late gesture is stale and is not retried
+            max_retries: Retries after a connection error, 429 or 503 (the
+                cases where the server cannot have run the action)
+            base_delay: Delay before the first retry in seconds (doubles each retry)
+            jitter: Random fraction added on top of each retry delay
+            max_delay: Upper bound on any retry delay in seconds; a 429 asking
+                for a longer wait drops the request instead
+            dedupe_window: Repeats of the same gesture and state within this
+                many seconds are not resent
+            session: Shared HTTP session (a private one is created if None)
         """
         self.server_url = server_url.rstrip("/")
         self.timeout = timeout
+        self.send_timeout = send_timeout
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.jitter = jitter
+        self.max_delay = max_delay
+        self._dedupe_window = dedupe_window
+
+        # Last (gesture, state) queued and when, for coalescing repeats
+        self._last_key = None
+        self._last_ts = 0.0
+
+        # Persistent keep-alive session so each gesture reuses a pooled connection
+        self._owns_session = session is None
+        self._session = session if session is not None else create_session()
+        self._detect_url = f"{self.server_url}/api/detect-gesture"
+        self._batch_url = f"{self.server_url}/api/detect-gesture/batch"
+        self._gestures_url = f"{self.server_url}/api/gestures"
+        self._status_url = f"{self.server_url}/api/python-status"
 
         # Statistics
         self.gestures_sent = 0
         self.successful_sends = 0
         self.failed_sends = 0
+        self.dropped_sends = 0  # Rejected because the send queue was full
+
+        # Gestures are queued and posted by a background thread so callers never
+        # block on the network; bursts are coalesced into one batch request
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue(
+            maxsize=SEND_QUEUE_SIZE
+        )
+        self._flush_thread = threading.Thread(
+            target=self._flush_loop, name="actions-flush", daemon=True
+        )
+        self._flush_thread.start()
 
         logger.info(
             f"ActionsClient initialized - Server: {server_url}"
@@ -59,72 +153,158 @@ class ActionsClient:
             gesture_state: State of the gesture - 'detected', 'started', 'ended'
 
         Returns:
-            True if sent successfully, False otherwise
+            True if queued (or coalesced with an identical recent send), False otherwise
         """
         if not gesture:
             logger.warning("Empty gesture provided")
             return False
 
-        # Generate timestamp if not provided
+        # The recognizer repeats the same label every frame; resending an
+        # identical event carries no new information
+        key = (gesture, gesture_state)
+        now = time.monotonic()
+        if key == self._last_key and now - self._last_ts < self._dedupe_window:
+            return True
+        self._last_key, self._last_ts = key, now
+
+        # Generate timestamp if not provided (millisecond precision is plenty)
         if timestamp is None:
-            timestamp = datetime.now().isoformat()
+            timestamp = datetime.now().isoformat(timespec="milliseconds")
 
         # Prepare message
         message = {"gesture": gesture, "timestamp": timestamp, "gestureState": gesture_state}
 
         self.gestures_sent += 1
 
-        # Send via HTTP
-        return self._send_via_http(message)
-
-    def _send_via_http(self, message: Dict[str, Any]) -> bool:
+        # Hand off to the flush thread
+        try:
+            self._queue.put_nowait(message)
+        except queue.Full:
+            # Backpressure: shed new gestures rather than block the caller
+            logger.warning(f"Send queue full, dropping gesture '{gesture}'")
+            self.dropped_sends += 1
+            return False
+        return True
+
+    def _flush_loop(self):
+        """Drain the send queue, coalescing any backlog into one request."""
+        while True:
+            message = self._queue.get()
+            if message is _STOP:
+                return
+
+            # Pick up whatever queued while the previous request was in flight
+            messages = [message]
+            stopping = False
+            while len(messages) < MAX_BATCH_SIZE:
+                try:
+                    message = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if message is _STOP:
+                    stopping = True
+                    break
+                messages.append(message)
+
+            try:
+                self._send_via_http(messages)
+            except Exception as e:
+                # Never let a bad response take down the flush thread
+                logger.error(f"Unexpected error flushing gestures: {e}")
+            if stopping:
+                return
+
+    def _send_via_http(self, messages: List[Dict[str, Any]]) -> bool:
         """
-        Send gesture via HTTP API.
+        Send gestures via HTTP API.
+
+        A single gesture is posted to the detect endpoint; a backlog is posted
+        to the batch endpoint in one request.
 
         Args:
-            message: Gesture message dictionary
+            messages: Gesture message dictionaries, oldest first
 
         Returns:
             True if successful, False otherwise
         """
-        try:
-            url = f"{self.server_url}/api/detect-gesture"
-            headers = {"Content-Type": "application/json"}
-
-            response = requests.post(
-                url, json=message, headers=headers, timeout=self.timeout
-            )
-
-            if response.status_code == 200:
-                result = response.json()
-                logger.info(
-                    f"Gesture '{message['gesture']}' sent successfully via HTTP"
-                )
-                logger.debug(f"Server response: {result}")
-                self.successful_sends += 1
-                return True
-            else:
-                logger.error(
-                    f"HTTP request failed: {response.status_code} - {response.text}"
+        if len(messages) == 1:
+            url, payload = self._detect_url, messages[0]
+        else:
+            url, payload = self._batch_url, {"events": messages}
+
+        # Encode once; retries resend the same bytes
+        body = _json_dumps(payload)
+
+        for attempt in range(self.max_retries + 1):
+            retry_after = None
+            try:
+                response = self._session.post(
+                    url,
+                    data=body,
+                    headers=_JSON_HEADERS,
+                    timeout=self.send_timeout,
                 )
-                self.failed_sends += 1
+            except requests.exceptions.ConnectionError:
+                # Includes connect timeouts: nothing was delivered, so resending
+                # cannot run an action twice
+                error = f"Connection error - is the action server running on {self.server_url}?"
+            except requests.exceptions.Timeout:
+                # The server may still be running the actions; a resend would
+                # replay them
+                error = f"HTTP request timeout for {_describe(messages)}"
+                break
+            except Exception as e:
+                logger.error(f"Unexpected error sending gesture via HTTP: {e}")
+                self.failed_sends += len(messages)
                 return False
-
-        except requests.exceptions.Timeout:
-            logger.error(f"HTTP request timeout for gesture '{message['gesture']}'")
-            self.failed_sends += 1
-            return False
-        except requests.exceptions.ConnectionError:
-            logger.error(
-                f"Connection error - is the action server running on {self.server_url}?"
+            else:
+                if response.status_code == 200:
+                    # The body is only an acknowledgement, so it is never parsed
+                    # One line per gesture is too costly at INFO on a busy stream
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Sent %s via HTTP", _describe(messages))
+                        logger.debug("Server response: %d bytes", len(response.content))
+                    self.successful_sends += len(messages)
+                    return True
+
+                error = f"HTTP request failed: {response.status_code} - {response.text}"
+                if response.status_code == 429:
+                    retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+                    if retry_after is not None and retry_after > self.max_delay:
+                        # Waiting would stall every gesture queued behind these,
+                        # and they would be stale by the time they were sent
+                        error = (
+                            f"{error} (Retry-After {retry_after:g}s exceeds "
+                            f"max_delay, dropping {_describe(messages)})"
+                        )
+                        break
+                elif response.status_code != 503:
+                    # Client errors fail the same way again, and any other
+                    # server error may come after an action already ran
+                    break
+
+            if attempt == self.max_retries:
+                break
+
+            if retry_after is None:
+                retry_after = self._backoff_delay(attempt)
+            logger.debug(
+                "%s - retrying in %.2fs (%d/%d)",
+                error,
+                retry_after,
+                attempt + 1,
+                self.max_retries,
             )
-            self.failed_sends += 1
-            return False
-        except Exception as e:
-            logger.error(f"Unexpected error sending gesture via HTTP: {e}")
-            self.failed_sends += 1
-            return False
+            time.sleep(retry_after)
+
+        logger.error(error)
+        self.failed_sends += len(messages)
+        return False
 
+    def _backoff_delay(self, attempt: int) -> float:
+        """Exponential backoff with jitter for the given retry attempt (0-based)."""
+        delay = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return delay * (1 + random.uniform(0, self.jitter))
 
     def test_connection(self) -> bool:
         """
@@ -134,8 +314,7 @@ class ActionsClient:
             True if server is reachable, False otherwise
         """
         try:
-            url = f"{self.server_url}/api/gestures"
-            response = requests.get(url, timeout=self.timeout)
+            response = self._session.get(self._gestures_url, timeout=self.timeout)
 
             if response.status_code == 200:
                 logger.info("Action server is reachable")
@@ -156,11 +335,10 @@ class ActionsClient:
             Dictionary of gesture mappings or None if failed
         """
         try:
-            url = f"{self.server_url}/api/gestures"
-            response = requests.get(url, timeout=self.timeout)
+            response = self._session.get(self._gestures_url, timeout=self.timeout)
 
             if response.status_code == 200:
-                mappings = response.json()
+                mappings = _json_loads(response.content)
                 logger.info(f"Retrieved {len(mappings)} gesture mappings")
                 return mappings
             else:
@@ -171,6 +349,28 @@ class ActionsClient:
             logger.error(f"Error getting gesture mappings: {e}")
             return None
 
+    def report_python_status(self, status: str) -> bool:
+        """
+        Tell the server about the recognizer process state.
+
+        Args:
+            status: Process status, e.g. 'stopped'
+
+        Returns:
+            True if the server accepted the update, False otherwise
+        """
+        try:
+            response = self._session.post(
+                self._status_url,
+                data=_json_dumps({"status": status}),
+                headers=_JSON_HEADERS,
+                timeout=self.timeout,
+            )
+            return response.status_code == 200
+        except Exception as e:
+            logger.warning(f"Could not report Python status '{status}': {e}")
+            return False
+
     def get_statistics(self) -> Dict[str, int]:
         """
         Get client statistics.
@@ -182,48 +382,79 @@ class ActionsClient:
             "gestures_sent": self.gestures_sent,
             "successful_sends": self.successful_sends,
             "failed_sends": self.failed_sends,
+            "dropped_sends": self.dropped_sends,
+            "pending_sends": self._queue.qsize(),
             "success_rate": (self.successful_sends / max(self.gestures_sent, 1)) * 100,
         }
 
 
     def cleanup(self):
         """Clean up resources."""
+        # Let the flush thread send anything still queued before closing
+        try:
+            self._queue.put(_STOP, timeout=self.timeout)
+        except queue.Full:
+            logger.warning("Send queue still full at shutdown")
+        self._flush_thread.join(timeout=self.timeout)
+        if self._owns_session:
+            self._session.close()
         logger.info("ActionsClient cleaned up")
 
 
-# Gesture mapping for common gestures to action server format
-GESTURE_MAPPINGS = {
-    "fist": "fist",
-    "open_palm": "open_palm",
-    "thumbs_up": "thumbs_up",
-    "thumbs_down": "thumbs_down",
-    "peace": "peace",
-    "victory": "victory",
-    "call_sig   n": "call_sign",
-    "call": "call",
-    "hang_loose": "hang_loose",
-    "pointing": "pointing",
-    "pointing_up": "pointing_up",
-    "pointing_right": "pointing_right",
-    "l_shape": "l_shape",
-    "rock": "rock",
-    "rock_on": "rock_on",
-    "rock_sign": "rock_sign",
-    "ok": "ok",
-    "ok_sign": "ok_sign",
-    "pinch": "pinch",
-    "spock": "spock",
-    "three_fingers": "three_fingers",
-    "three_fingers_v2": "three_fingers_v2",
-    "middle_finger": "middle_finger",
-    "ring_finger": "ring_finger",
-    "pinky": "pinky",
-    "two_fingers_ir": "two_fingers_ir",
-    "two_fingers_mr": "two_fingers_mr",
-    "four_fingers": "four_fingers",
-    "wave": "wave",
-}
-
+def _describe(messages: List[Dict[str, Any]]) -> str:
+    """Describe a group of gesture messages for log output."""
+    if len(messages) == 1:
+        return f"gesture '{messages[0]['gesture']}'"
+    return f"batch of {len(messages)} gestures"
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds; HTTP dates are ignored."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+# Gestures whose recognizer name is already the action server name
+_GESTURE_IDENTITY = frozenset(
+    {
+        "fist",
+        "open_palm",
+        "thumbs_up",
+        "thumbs_down",
+        "peace",
+        "victory",
+        "call_sign",
+        "call",
+        "hang_loose",
+        "pointing",
+        "pointing_up",
+        "pointing_right",
+        "l_shape",
+        "rock",
+        "rock_on",
+        "rock_sign",
+        "ok",
+        "ok_sign",
+        "pinch",
+        "spock",
+        "three_fingers",
+        "three_fingers_v2",
+        "middle_finger",
+        "ring_finger",
+        "pinky",
+        "two_fingers_ir",
+        "two_fingers_mr",
+        "four_fingers",
+        "wave",
+    }
+)
+
+# Recognizer names that the action server knows under a different name
+_GESTURE_RENAMES: Dict[str, str] = {}
 
 
 def map_gesture_name(detected_gesture: str) -> str:
@@ -236,7 +467,9 @@ def map_gesture_name(detected_gesture: str) -> str:
     Returns:
         Mapped gesture name for action server
     """
-    return GESTURE_MAPPINGS.get(detected_gesture, detected_gesture)
+    if detected_gesture in _GESTURE_IDENTITY:
+        return detected_gesture
+    return _GESTURE_RENAMES.get(detected_gesture, detected_gesture)
 
 
 if __name__ == "__main__":
@@ -244,7 +477,8 @@ if __name__ == "__main__":
     print("Testing Actions Client...")
 
     # Initialize client
-    client = ActionsClient()
+    session = create_session()
+    client = ActionsClient(session=session)
 
     # Test connection
     if not client.test_connection():
@@ -252,6 +486,7 @@ if __name__ == "__main__":
         print("Make sure to start the action server first:")
         print("  cd /path/to/BigRedHacks")
         print("  npm start")
+        session.close()
         exit(1)
 
     print("✅ Action server is reachable")
@@ -269,19 +504,22 @@ if __name__ == "__main__":
         print(f"Sending gesture: {gesture}")
         success = client.send_gesture(gesture)
         if success:
-            print(f"  ✅ {gesture} sent successfully")
+            print(f"  ✅ {gesture} queued")
         else:
-            print(f"  ❌ Failed to send {gesture}")
+            print(f"  ❌ Failed to queue {gesture}")
         time.sleep(1)  # Small delay between tests
 
+    # Flush pending sends before reading statistics
+    client.cleanup()
+    session.close()
+
     # Show statistics
     stats = client.get_statistics()
     print(f"\n📊 Statistics:")
     print(f"  Total gestures sent: {stats['gestures_sent']}")
     print(f"  Successful: {stats['successful_sends']}")
     print(f"  Failed: {stats['failed_sends']}")
+    print(f"  Dropped: {stats['dropped_sends']}")
     print(f"  Success rate: {stats['success_rate']:.1f}%")
 
-    # Cleanup
-    client.cleanup()
     print("\n✅ Test completed!")
@@ -9,13 +9,12 @@ For: BigRedHacks MVP
 import cv2
 import threading
 import time
-import base64
 import json
 import logging
 from typing import Optional
 import requests
-from io import BytesIO
-from PIL import Image
+
+from actions_client import create_session
 
 logger = logging.getLogger(__name__)
 
@@ -25,22 +24,47 @@ class CameraStreamer:
     Streams camera feed to web frontend via HTTP endpoint.
     """
 
-    def __init__(self, camera_index: int = 1, server_url: str = "http://localhost:3001"):
+    def __init__(
+        self,
+        camera_index: int = 1,
+        server_url: str = "http://localhost:3001",
+        session: Optional[requests.Session] = None,
+    ):
         """
         Initialize camera streamer.
 
         Args:
             camera_index: Camera device index
             server_url: URL of the web server to send frames to
+            session: Shared HTTP session (a private one is created if None)
         """
         self.camera_index = camera_index
         self.server_url = server_url.rstrip("/")
         self.cap = None
         self.streaming = False
-        self.frame_data = None
         self.last_gesture = None
-        self.frame_lock = threading.Lock()
-        
+
+        # Frames move capture -> encoder -> sender through latest-wins slots:
+        # _raw_slot holds (ndarray, timestamp, gesture) and _latest holds
+        # (jpeg_bytes, timestamp, gesture). The lock is only held for reference
+        # swaps, never across encoding or network I/O.
+        self._raw_slot = None
+        self._latest = None
+        self._lock = threading.Lock()
+        self._raw_event = threading.Event()  # Set when a raw frame is published
+        self._frame_event = threading.Event()  # Set when a JPEG is published
+        self._frame_url = f"{self.server_url}/api/camera-frame"
+        self.frame_interval = 0.1  # Stream at ~10 FPS to reduce bandwidth
+
+        # JPEG quality follows a smoothed send latency so a slow server gets
+        # smaller frames; written by the stream loop, read by the encoder
+        self._ewma_latency = 0.0
+        self._quality = 85
+
+        # Keep-alive session so frames reuse one connection
+        self._owns_session = session is None
+        self._session = session if session is not None else create_session()
+
         logger.info(f"CameraStreamer initialized for camera {camera_index}")
 
     def start_camera(self) -> bool:
@@ -78,12 +102,16 @@ class CameraStreamer:
         self.streaming = True
         logger.info("Starting camera stream to web server")
 
-        # Start streaming thread
+        # Start encoder and streaming threads
+        threading.Thread(target=self._encode_loop, daemon=True).start()
         threading.Thread(target=self._stream_loop, daemon=True).start()
 
     def stop_streaming(self):
         """Stop streaming camera feed."""
         self.streaming = False
+        # Wake the encoder and stream loops so they can exit
+        self._raw_event.set()
+        self._frame_event.set()
         logger.info("Stopping camera stream")
 
     def stop_camera(self):
@@ -92,69 +120,128 @@ class CameraStreamer:
         if self.cap:
             self.cap.release()
             self.cap = None
+        if self._owns_session:
+            self._session.close()
         logger.info("Camera stopped")
 
-    def update_frame(self, frame, detected_gesture: Optional[str] = None):
+    def update_frame(
+        self, frame, detected_gesture: Optional[str] = None, copy: bool = True
+    ):
         """
         Update the current frame data.
 
         Args:
             frame: OpenCV frame (BGR format)
             detected_gesture: Recently detected gesture name
+            copy: Snapshot the frame; pass False to hand it over when the
+                caller will not modify it again
         """
         if frame is None:
             return
 
-        # Convert BGR to RGB
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        
-        # Convert to PIL Image
-        pil_image = Image.fromarray(rgb_frame)
-        
-        # Resize for web display
-        pil_image = pil_image.resize((640, 480), Image.Resampling.LANCZOS)
-        
-        # Convert to base64
-        buffer = BytesIO()
-        pil_image.save(buffer, format='JPEG', quality=85)
-        img_str = base64.b64encode(buffer.getvalue()).decode()
-
-        with self.frame_lock:
-            self.frame_data = {
-                'image': img_str,
-                'timestamp': time.time(),
-                'gesture': detected_gesture
-            }
-            if detected_gesture:
-                self.last_gesture = detected_gesture
+        # Encoding happens on the encoder thread, which reads the frame later
+        if copy:
+            frame = frame.copy()
+        raw = (frame, time.time(), detected_gesture)
+        with self._lock:
+            self._raw_slot = raw
+        self._raw_event.set()
+        if detected_gesture:
+            self.last_gesture = detected_gesture
+
+    def _encode_loop(self):
+        """Encoder loop that turns the newest raw frame into JPEG bytes."""
+        while self.streaming:
+            try:
+                if not self._raw_event.wait(timeout=1.0):
+                    continue
+                self._raw_event.clear()
+
+                with self._lock:
+                    raw, self._raw_slot = self._raw_slot, None
+                if raw is None:
+                    continue
+
+                frame, timestamp, gesture = raw
+                jpeg = self._encode_frame(frame)
+                if jpeg is None:
+                    continue
+
+                with self._lock:
+                    self._latest = (jpeg, timestamp, gesture)
+                self._frame_event.set()
+
+            except Exception as e:
+                logger.error(f"Error in encoder loop: {e}")
+                time.sleep(1)
+
+    def _encode_frame(self, frame) -> Optional[bytes]:
+        """
+        JPEG-encode a frame for the web frontend.
+
+        Args:
+            frame: OpenCV frame (BGR format)
+
+        Returns:
+            JPEG bytes, or None if encoding failed
+        """
+        # Resize for web display; camera frames are usually 640x480 already,
+        # in which case the ndarray is handed to the encoder without any copy
+        if frame.shape[:2] != (480, 640):
+            frame = cv2.resize(frame, (640, 480), interpolation=cv2.INTER_AREA)
+
+        # Encode straight from BGR; JPEG does not care about channel order here
+        ok, buffer = cv2.imencode('.jpg', frame, [int(cv2.IMWRITE_JPEG_QUALITY), self._quality])
+        if not ok:
+            logger.warning("Failed to encode camera frame")
+            return None
+        return buffer.tobytes()
 
     def _stream_loop(self):
         """Main streaming loop that sends frames to web server."""
         while self.streaming:
             try:
-                with self.frame_lock:
-                    if self.frame_data:
-                        # Send frame to web server
-                        self._send_frame_to_server(self.frame_data)
-                
-                # Stream at ~10 FPS to reduce bandwidth
-                time.sleep(0.1)
-                
+                # Sleep until update_frame publishes something new
+                if not self._frame_event.wait(timeout=1.0):
+                    continue
+                self._frame_event.clear()
+
+                # Take the newest frame; anything older was superseded
+                with self._lock:
+                    latest, self._latest = self._latest, None
+
+                if latest:
+                    # Send frame to web server
+                    sent_at = time.monotonic()
+                    self._send_frame_to_server(latest)
+
+                    # Cap the send rate; frames published meanwhile are coalesced
+                    remaining = self.frame_interval - (time.monotonic() - sent_at)
+                    if remaining > 0:
+                        time.sleep(remaining)
+
             except Exception as e:
                 logger.error(f"Error in streaming loop: {e}")
                 time.sleep(1)
 
-    def _send_frame_to_server(self, frame_data):
+    def _send_frame_to_server(self, frame):
         """
-        Send frame data to web server.
+        Send frame data to web server as a raw JPEG body.
 
         Args:
-            frame_data: Dictionary containing image and metadata
+            frame: Tuple of (jpeg_bytes, timestamp, gesture)
         """
+        jpeg, timestamp, gesture = frame
+        t0 = time.monotonic()
         try:
-            response = requests.post(
-                f"{self.server_url}/api/camera-frame",
-                json=frame_data,
+            response = self._session.post(
+                self._frame_url,
+                data=jpeg,
+                headers={
+                    'Content-Type': 'image/jpeg',
+                    'X-Timestamp': str(timestamp),
+                    'X-Gesture': gesture or '',
+                },
                 timeout=1.0
             )
             
@@ -165,6 +252,22 @@ class CameraStreamer:
             # Don't log every connection error to avoid spam
             pass
 
+        self._update_quality(time.monotonic() - t0)
+
+    def _update_quality(self, latency: float):
+        """
+        Adapt JPEG quality to the observed send latency.
+
+        Quality is 90 at or below ~30 ms and falls to 50 as the average
+        approaches ~130 ms.
+
+        Args:
+            latency: Duration of the last frame POST in seconds
+        """
+        self._ewma_latency = 0.8 * self._ewma_latency + 0.2 * latency
+        pressure = min(1.0, max(0.0, (self._ewma_latency - 0.03) / 0.1))
+        self._quality = max(50, min(90, int(90 - 60 * pressure)))
+
     def get_last_gesture(self) -> Optional[dict]:
         """
         Get information about the last detected gesture.
@@ -184,16 +287,21 @@ class CameraStreamer:
 camera_streamer = None
 
 
-def initialize_camera_streamer(camera_index: int = 1, server_url: str = "http://localhost:3001"):
+def initialize_camera_streamer(
+    camera_index: int = 1,
+    server_url: str = "http://localhost:3001",
+    session: Optional[requests.Session] = None,
+):
     """
     Initialize the global camera streamer.
 
     Args:
         camera_index: Camera device index
         server_url: URL of the web server
+        session: Shared HTTP session (a private one is created if None)
     """
     global camera_streamer
-    camera_streamer = CameraStreamer(camera_index, server_url)
+    camera_streamer = CameraStreamer(camera_index, server_url, session)
     return camera_streamer
 
 
@@ -211,7 +319,8 @@ if __name__ == "__main__":
     # Test the camera streamer
     print("Testing Camera Streamer...")
     
-    streamer = CameraStreamer(camera_index=1)
+    session = create_session()
+    streamer = CameraStreamer(camera_index=1, session=session)
     
     if streamer.start_camera():
         print("✅ Camera started successfully")
@@ -232,3 +341,4 @@ if __name__ == "__main__":
             streamer.stop_camera()
     else:
         print("❌ Failed to start camera")
+    session.close()
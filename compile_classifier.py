@@ -0,0 +1,37 @@
+"""
+Ahead-of-Time Classifier Build
+Compiles the gesture classifier kernels into a native extension module.
+
+Run once after installing dependencies:
+
+    python compile_classifier.py
+
+This writes gesture_kernels.*.so (or .pyd on Windows) next to this file.
+gesture_recognition.py imports it when present, so the classifier is native
+from the first frame with no JIT warm-up and no numba needed at runtime;
+otherwise it falls back to the JIT-compiled kernels in _classify_numba.py.
+Rebuild after changing _classify_numba.py or the gesture ids in _gestures.py.
+
+Author: Gesture Recognition Team Member
+For: BigRedHacks MVP
+"""
+
+import os
+
+from numba.pycc import CC
+
+import _classify_numba
+
+cc = CC("gesture_kernels")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Same source and signatures as the JIT kernels
+cc.export("classify", "i4(f4[:, ::1])")(_classify_numba.classify.py_func)
+cc.export("wave_counts", "UniTuple(i8, 2)(f4[::1], i8, f4)")(
+    _classify_numba.wave_counts.py_func
+)
+
+
+if __name__ == "__main__":
+    cc.compile()
+    print(f"Built gesture_kernels in {cc.output_dir}")
@@ -12,11 +12,60 @@ import numpy as np
 from typing import Optional, Dict, List, Tuple
 import time
 import logging
+import platform
+import threading
+from collections import deque
+
+from _gestures import GESTURE_NAMES, NO_GESTURE, WAVE_THRESHOLD
+
+# Prefer the ahead-of-time build (see compile_classifier.py) over the JIT
+# kernels; _classify_numba (and with it numba) is only loaded as the fallback
+try:
+    from gesture_kernels import classify as classify_pose, wave_counts
+except ImportError:
+    from _classify_numba import classify as classify_pose, wave_counts
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Wire layout of a serialized NormalizedLandmarkList whose landmarks carry only
+# x, y and z: per landmark a field-1 tag and length byte, then three tagged
+# little-endian floats (17 bytes)
+_LANDMARK_RECORD = np.dtype(
+    [
+        ("tag", "u1"),
+        ("size", "u1"),
+        ("x_tag", "u1"),
+        ("x", "<f4"),
+        ("y_tag", "u1"),
+        ("y", "<f4"),
+        ("z_tag", "u1"),
+        ("z", "<f4"),
+    ]
+)
+_NUM_LANDMARKS = 21
+
+# MediaPipe runs its own XNNPACK thread pool and the OpenCV calls here work on
+# small images, so keep OpenCV from oversubscribing the cores with a second pool
+cv2.setNumThreads(1)
+
+# Native capture backend per OS (CameraManager falls back to CAP_ANY)
+_CAPTURE_BACKENDS = {
+    "Linux": cv2.CAP_V4L2,
+    "Windows": cv2.CAP_MSMF,
+    "Darwin": cv2.CAP_AVFOUNDATION,
+}
+
+
+class _TaskHand:
+    """Adapts a Tasks API landmark list to the legacy ``.landmark`` shape."""
+
+    __slots__ = ("landmark",)
+
+    def __init__(self, landmark):
+        self.landmark = landmark
+
 
 class GestureRecognizer:
     """
@@ -29,6 +78,10 @@ class GestureRecognizer:
         min_detection_confidence: float = 0.9,
         min_tracking_confidence: float = 0.5,
         max_num_hands: int = 1,
+        model_complexity: int = 0,
+        model_asset_path: Optional[str] = None,
+        use_gpu: bool = False,
+        detection_width: Optional[int] = 256,
     ):
         """
         Initialize the gesture recognizer.
@@ -37,22 +90,63 @@ class GestureRecognizer:
             min_detection_confidence: Minimum confidence for hand detection
             min_tracking_confidence: Minimum confidence for hand tracking
             max_num_hands: Maximum number of hands to detect
+            model_complexity: Legacy Hands landmark model, 0 (lite, faster)
+                or 1 (full, slightly more accurate)
+            model_asset_path: Path to a hand_landmarker.task bundle; when set,
+                the MediaPipe Tasks HandLandmarker is used instead of the
+                legacy Hands solution
+            use_gpu: Run the HandLandmarker on the GPU delegate (Tasks only)
+            detection_width: Width frames are shrunk to before detection
+                (None for full resolution)
         """
-        self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=max_num_hands,
-            min_detection_confidence=min_detection_confidence,
-            min_tracking_confidence=min_tracking_confidence,
-        )
-        self.mp_drawing = mp.solutions.drawing_utils
+        self._use_tasks = model_asset_path is not None
+        self._last_timestamp_ms = 0
+        if self._use_tasks:
+            from mediapipe.tasks.python import BaseOptions, vision
+
+            delegate = (
+                BaseOptions.Delegate.GPU if use_gpu else BaseOptions.Delegate.CPU
+            )
+            options = vision.HandLandmarkerOptions(
+                base_options=BaseOptions(
+                    model_asset_path=model_asset_path, delegate=delegate
+                ),
+                running_mode=vision.RunningMode.VIDEO,
+                num_hands=max_num_hands,
+                min_hand_detection_confidence=min_detection_confidence,
+                min_tracking_confidence=min_tracking_confidence,
+            )
+            self.hands = vision.HandLandmarker.create_from_options(options)
+            connections = [
+                (c.start, c.end)
+                for c in vision.HandLandmarksConnections.HAND_CONNECTIONS
+            ]
+        else:
+            # mp.solutions is only touched here; Tasks-only builds lack it
+            self.mp_hands = mp.solutions.hands
+            self.hands = self.mp_hands.Hands(
+                static_image_mode=False,
+                max_num_hands=max_num_hands,
+                model_complexity=model_complexity,
+                min_detection_confidence=min_detection_confidence,
+                min_tracking_confidence=min_tracking_confidence,
+            )
+            connections = self.mp_hands.HAND_CONNECTIONS
+
+        # Landmark index pairs for drawing: the skeleton connections, and each
+        # joint as a zero-length segment so a thick line renders it as a dot
+        self._connections = np.array(sorted(connections), dtype=np.intp)
+        self._joints = np.repeat(np.arange(_NUM_LANDMARKS)[:, None], 2, axis=1)
 
         # Wave detection variables
-        self.hand_positions = []  # Store recent hand positions for wave detection
-        self.wave_threshold = (
-            0.05  # Minimum movement for wave detection (more sensitive)
-        )
+        self.wave_threshold = WAVE_THRESHOLD  # Minimum movement for wave detection
         self.wave_frames = 7  # Number of frames to analyze for wave (shorter window)
+        # Ring buffer of recent wrist x positions for wave detection (a wave
+        # is horizontal, so y is not kept); _wave_i is the next slot to write
+        # (and so the oldest once full)
+        self._wave_x = np.zeros(self.wave_frames, dtype=np.float32)
+        self._wave_i = 0
+        self._wave_filled = 0
         self.last_wave_time = 0  # Prevent rapid wave detections
 
         # Gesture detection state
@@ -64,372 +158,264 @@ class GestureRecognizer:
         self.continuous_gestures = {"thumbs_up", "thumbs_down"}
 
         # Gesture smoothing to prevent rapid switching
-        self.gesture_history = []  # Track last few gestures
         self.gesture_history_size = 5  # Number of recent gestures to track
+        # Track last few (gesture, time) pairs; the oldest falls off the end
+        self.gesture_history = deque(maxlen=self.gesture_history_size)
         self.similar_gestures = {
             "thumbs_up": ["fist", "thumbs_down"],
             "thumbs_down": ["fist", "thumbs_up"],
             "fist": ["thumbs_up", "thumbs_down"],
         }
 
+        # Per-hand landmark (x, y) buffers filled by detect_hands on every frame
+        self._hand_pts = np.empty(
+            (max_num_hands, _NUM_LANDMARKS, 2), dtype=np.float32
+        )
+
+        # Frames are shrunk to this width before detection (aspect ratio kept;
+        # landmarks are normalized anyway). Only the palm detector resizes its
+        # input to a fixed size; the landmark model crops the hand from the
+        # image it is given, so a smaller width costs landmark precision
+        self.detection_width = detection_width
+
+        # Downscale and RGB conversion targets, (re)allocated on size change
+        self._small = None
+        self._rgb_buf = None
+
+        # Motion gate: reuse the last landmarks while no pixel value of a
+        # 32x32 thumbnail differs by more than motion_threshold from the
+        # thumbnail of the last frame that went through MediaPipe. A pose
+        # change with a still wrist only touches a few cells, so the largest
+        # difference is compared rather than the mean; and landmarks are
+        # never reused for longer than max_gate_age seconds
+        self.motion_threshold = 12.0
+        self.max_gate_age = 0.1
+        self._gate_buf = None
+        self._gate_ref = None
+        self._last_landmarks = None
+
+        # Once no hand has been found for empty_frames_before_skip frames,
+        # only look for one on every skip_when_empty-th frame until it returns
+        self.empty_frames_before_skip = 5
+        self.skip_when_empty = 2
+        self._no_hand_streak = 0
+
+        # Adaptive skip: while MediaPipe is slower than the frame budget, frames
+        # arriving within one average inference time of the last inference
+        # are only drawn with its landmarks, keeping the display responsive
+        self.target_frame_time = 1.0 / 30
+        self._avg_infer_time = 0.0  # EWMA of detect_hands duration in seconds
+        self._last_infer_end = 0.0
+        self._last_label = None
+
         logger.info("GestureRecognizer initialized")
 
-    def detect_hands(self, frame: np.ndarray) -> Optional[List]:
+    def detect_hands(self, frame: np.ndarray) -> Optional[List[np.ndarray]]:
         """
         Detect hands in the given frame.
 
+        The landmarks are read out of MediaPipe once here; everything
+        downstream works on the returned arrays. They are views of reused
+        buffers, valid until the next call.
+
         Args:
             frame: Input image frame (BGR format)
 
         Returns:
-            Hand landmarks if detected, None otherwise
+            A float32 (21, 2) array of normalized (x, y) landmarks per hand
+            if detected, None otherwise
         """
-        # Convert BGR to RGB for MediaPipe
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        # Shrink to the detection width before handing the frame to MediaPipe
+        height, width = frame.shape[:2]
+        if self.detection_width and width > self.detection_width:
+            small_size = (
+                self.detection_width,
+                max(1, round(height * self.detection_width / width)),
+            )
+            if self._small is None or self._small.shape[1::-1] != small_size:
+                self._small = np.empty(
+                    (small_size[1], small_size[0], 3), dtype=np.uint8
+                )
+            cv2.resize(
+                frame, small_size, dst=self._small, interpolation=cv2.INTER_AREA
+            )
+            frame = self._small
 
-        # Process the frame
-        results = self.hands.process(rgb_frame)
+        # Convert BGR to RGB for MediaPipe into a reused buffer
+        if self._rgb_buf is None or self._rgb_buf.shape != frame.shape:
+            self._rgb_buf = np.empty_like(frame)
+        self._rgb_buf.flags.writeable = True
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
 
-        return results.multi_hand_landmarks if results.multi_hand_landmarks else None
+        # Read-only input lets MediaPipe use the buffer without copying it
+        self._rgb_buf.flags.writeable = False
 
-    def classify_gesture(self, landmarks) -> Optional[str]:
+        if self._use_tasks:
+            # VIDEO mode needs strictly increasing timestamps
+            timestamp_ms = max(
+                int(time.monotonic() * 1000), self._last_timestamp_ms + 1
+            )
+            self._last_timestamp_ms = timestamp_ms
+            image = mp.Image(image_format=mp.ImageFormat.SRGB, data=self._rgb_buf)
+            result = self.hands.detect_for_video(image, timestamp_ms)
+            hands = [_TaskHand(hand) for hand in result.hand_landmarks]
+        else:
+            # Process the frame
+            hands = self.hands.process(self._rgb_buf).multi_hand_landmarks
+
+        if not hands:
+            return None
+        return [
+            self._landmarks_to_np(landmarks, out)
+            for landmarks, out in zip(hands, self._hand_pts)
+        ]
+
+    def classify_gesture(
+        self, points: np.ndarray, now: Optional[float] = None
+    ) -> Optional[str]:
         """
         Classify gesture based on hand landmarks using rule-based approach.
 
         Args:
-            landmarks: MediaPipe hand landmarks
+            points: float32 (21, 2) array of normalized (x, y) landmarks
+            now: Current time.time() value (looked up if None)
 
         Returns:
             Gesture name or None if no gesture detected
         """
-        if not landmarks:
+        if points is None:
             return None
+        return self._detect(points, now)
 
-        # Get landmark positions as normalized coordinates
-        points = []
-        for landmark in landmarks.landmark:
-            points.append([landmark.x, landmark.y])
-        points = np.array(points)
-
-        # MediaPipe hand landmark indices
-        # 0: WRIST, 4: THUMB_TIP, 8: INDEX_FINGER_TIP, 12: MIDDLE_FINGER_TIP,
-        # 16: RING_FINGER_TIP, 20: PINKY_TIP
-        # 2: THUMB_IP, 3: THUMB_MCP, 6: INDEX_PIP, 10: MIDDLE_PIP, etc.
-
-        # Extract key points
-        wrist = points[0]
-        thumb_tip = points[4]
-        thumb_ip = points[3]  # Thumb interphalangeal joint
-        thumb_mcp = points[2]  # Thumb metacarpophalangeal joint
-        index_tip = points[8]
-        index_pip = points[6]  # Index proximal interphalangeal joint
-        index_mcp = points[5]  # Index metacarpophalangeal joint
-        middle_tip = points[12]
-        middle_pip = points[10]
-        middle_mcp = points[9]
-        ring_tip = points[16]
-        ring_pip = points[14]
-        ring_mcp = points[13]
-        pinky_tip = points[20]
-        pinky_pip = points[18]
-        pinky_mcp = points[17]
-
-        # Improved finger extension detection
-        def is_finger_extended(tip, pip, mcp, finger_name=""):
-            """Check if finger is extended with more accuracy."""
-            if finger_name == "thumb":
-                # For thumb: detect extension in any direction (up or down)
-                tip_to_wrist = np.linalg.norm(tip - wrist)
-                mcp_to_wrist = np.linalg.norm(thumb_mcp - wrist)
-
-                # Check if thumb is pointing up OR down (not curled)
-                thumb_pointing_up = thumb_tip[1] < thumb_mcp[1] - 0.02  # Above MCP
-                thumb_pointing_down = thumb_tip[1] > thumb_mcp[1] + 0.02  # Below MCP
-
-                # Thumb is extended if it's pointing up OR down (not curled)
-                distance_check = (
-                    tip_to_wrist > mcp_to_wrist * 1.4
-                )  # Less strict distance
-                return distance_check and (thumb_pointing_up or thumb_pointing_down)
-            else:
-                # For other fingers: tip should be above PIP and PIP above MCP
-                return tip[1] < pip[1] < mcp[1]
-
-        # Check each finger with improved accuracy
-        fingers_up = []
-        fingers_up.append(is_finger_extended(thumb_tip, thumb_ip, thumb_mcp, "thumb"))
-        fingers_up.append(is_finger_extended(index_tip, index_pip, index_mcp, "index"))
-        fingers_up.append(
-            is_finger_extended(middle_tip, middle_pip, middle_mcp, "middle")
-        )
-        fingers_up.append(is_finger_extended(ring_tip, ring_pip, ring_mcp, "ring"))
-        fingers_up.append(is_finger_extended(pinky_tip, pinky_pip, pinky_mcp, "pinky"))
-
-        extended_count = sum(fingers_up)
+    def _detect(self, points: np.ndarray, now: Optional[float]) -> Optional[str]:
+        """
+        Classify a hand that is known to be present.
 
-        # Enhanced rule-based gesture classification
+        Args:
+            points: float32 (21, 2) array of normalized (x, y) landmarks
+            now: Current time.time() value (looked up if None)
 
+        Returns:
+            Gesture name or None if no gesture detected
+        """
         # WAVE: Check for wave motion pattern first (motion-based)
-        if self.detect_wave(landmarks):
+        if self._update_wave(points[0, 0], now):
             return "wave"
 
-        # THREE FINGER SIGN V2: Thumb, index, and middle fingers up (check FIRST)
-        if (
-            fingers_up[0]
-            and fingers_up[1]
-            and fingers_up[2]
-            and not fingers_up[3]
-            and not fingers_up[4]
-        ):
-            return "three_fingers_serbian_style"
-
-        # FIST: No fingers extended OR thumb slightly extended but not pointing up
-        if extended_count == 0:
-            return "fist"
-        elif extended_count == 1 and fingers_up[0]:
-            # Only thumb is extended - determine if it's thumbs up or thumbs down
-            # Check thumb position relative to wrist and other fingers
-            other_fingers_y = [index_tip[1], middle_tip[1], ring_tip[1], pinky_tip[1]]
-            avg_other_fingers_y = np.mean(other_fingers_y)
-
-            # Thumb should be significantly above other fingers for thumbs up
-            thumb_clearly_up = thumb_tip[1] < avg_other_fingers_y - 0.03
-            # Thumb should be below other fingers for thumbs down
-            thumb_clearly_down = thumb_tip[1] > avg_other_fingers_y + 0.02
-
-            if thumb_clearly_up:
-                return "thumbs_up"
-            elif thumb_clearly_down:
-                return "thumbs_down"
-            else:
-                # Check relative to wrist for additional thumbs down detection
-                if thumb_tip[1] > wrist[1] + 0.03:  # Thumb tip below wrist
-                    return "thumbs_down"
-                else:
-                    # If thumb is only slightly extended, it's probably a fist
-                    return "fist"
-
-        # OPEN PALM: All fingers extended
-        elif extended_count == 5:
-            return "open_palm"
-
-        # PEACE SIGN: Index and middle fingers extended, others down (relaxed)
-        elif (
-            fingers_up[1] and fingers_up[2] and not fingers_up[3] and not fingers_up[4]
-        ):
-            # Allow thumb to be up or down for peace sign
-            return "peace"
-
-        # CALL SIGN (Hang Loose): Only thumb and pinky extended
-        elif (
-            extended_count == 2
-            and fingers_up[0]
-            and fingers_up[4]
-            and not fingers_up[1]
-            and not fingers_up[2]
-            and not fingers_up[3]
-        ):
-            return "call"
-
-        # L SHAPE: Thumb and index finger extended, others down
-        elif (
-            fingers_up[0]
-            and fingers_up[1]
-            and not fingers_up[2]
-            and not fingers_up[3]
-            and not fingers_up[4]
-        ):
-            return "l_shape"
-
-        # POINTING: Index finger extended, others down (relaxed)
-        elif (
-            fingers_up[1]
-            and not fingers_up[2]
-            and not fingers_up[3]
-            and not fingers_up[4]
-        ):
-            # Allow thumb to be up or down for pointing
-            return "pointing"
-
-        # ROCK SIGN: Index and pinky extended, middle and ring down
-        elif (
-            fingers_up[1] and fingers_up[4] and not fingers_up[2] and not fingers_up[3]
-        ):
-            # Allow thumb to be up or down for rock sign
-            return "rock"
-
-        # THREE FINGER SIGN: Index, middle, and ring fingers up
-        elif fingers_up[1] and fingers_up[2] and fingers_up[3] and not fingers_up[4]:
-            # Allow thumb to be up or down for three finger sign
-            return "three_fingers"
-
-        # MIDDLE FINGER: Only middle finger extended
-        elif (
-            fingers_up[2]
-            and not fingers_up[1]
-            and not fingers_up[3]
-            and not fingers_up[4]
-        ):
-            # Allow thumb to be up or down
-            return "middle_finger"
-
-        # RING FINGER: Only ring finger extended
-        elif (
-            fingers_up[3]
-            and not fingers_up[1]
-            and not fingers_up[2]
-            and not fingers_up[4]
-        ):
-            # Allow thumb to be up or down
-            return "ring_finger"
-
-        # PINKY: Only pinky finger extended
-        elif (
-            fingers_up[4]
-            and not fingers_up[1]
-            and not fingers_up[2]
-            and not fingers_up[3]
-        ):
-            # Allow thumb to be up or down
-            return "pinky"
+        # Static poses are classified by the compiled rule kernel
+        gesture_id = classify_pose(points)
+        if gesture_id == NO_GESTURE:
+            return None
+        return GESTURE_NAMES[gesture_id]
 
-        # TWO FINGERS (Index + Ring): Index and ring up, middle and pinky down
-        elif (
-            fingers_up[1] and fingers_up[3] and not fingers_up[2] and not fingers_up[4]
-        ):
-            return "two_fingers_ir"
+    @staticmethod
+    def _landmarks_to_np(landmarks, points: np.ndarray) -> np.ndarray:
+        """
+        Copy landmark (x, y) coordinates into a reused points buffer.
 
-        # TWO FINGERS (Middle + Ring): Middle and ring up, index and pinky down
-        elif (
-            fingers_up[2] and fingers_up[3] and not fingers_up[1] and not fingers_up[4]
-        ):
-            return "two_fingers_mr"
+        Decodes the serialized protobuf in one pass when it has the plain
+        x/y/z layout, instead of reading 42 fields through the Python
+        protobuf accessors; anything else goes through the accessors.
 
-        # FOUR FINGERS: All except thumb
-        elif (
-            fingers_up[1]
-            and fingers_up[2]
-            and fingers_up[3]
-            and fingers_up[4]
-            and not fingers_up[0]
-        ):
-            return "four_fingers"
-
-        # PINCH SIGN: Thumb and index close together, others down
-        elif (
-            extended_count == 2
-            and fingers_up[0]
-            and fingers_up[1]
-            and not fingers_up[2]
-            and not fingers_up[3]
-            and not fingers_up[4]
-        ):
-            # Check if thumb and index are close (pinch gesture)
-            thumb_index_distance = np.linalg.norm(thumb_tip - index_tip)
-            if thumb_index_distance < 0.05:  # Threshold for "close"
-                return "pinch"
+        Args:
+            landmarks: MediaPipe hand landmarks
+            points: float32 (21, 2) array to fill
 
-        # SPOCK SIGN: Index and middle fingers separated (Vulcan salute)
-        elif (
-            fingers_up[1]
-            and fingers_up[2]
-            and not fingers_up[0]
-            and not fingers_up[3]
-            and not fingers_up[4]
+        Returns:
+            The filled points array
+        """
+        serialize = getattr(landmarks, "SerializeToString", None)
+        buf = serialize() if serialize is not None else b""
+        if (
+            len(buf) == _NUM_LANDMARKS * _LANDMARK_RECORD.itemsize
+            and buf[0::17] == b"\x0a" * _NUM_LANDMARKS
+            and buf[1::17] == b"\x0f" * _NUM_LANDMARKS
+            and buf[2::17] == b"\x0d" * _NUM_LANDMARKS
+            and buf[7::17] == b"\x15" * _NUM_LANDMARKS
+            and buf[12::17] == b"\x1d" * _NUM_LANDMARKS
         ):
-            # Check if fingers are separated (not peace sign)
-            index_middle_distance = np.linalg.norm(index_tip - middle_tip)
-            if index_middle_distance > 0.08:  # Threshold for "separated"
-                return "spock"
-
-        # OK SIGN: Thumb and index close together, middle/ring/pinky extended
-        elif extended_count >= 3 and fingers_up[2] and fingers_up[3] and fingers_up[4]:
-            # Check if thumb and index are close (OK sign approximation)
-            thumb_index_distance = np.linalg.norm(thumb_tip - index_tip)
-            if thumb_index_distance < 0.05:  # Threshold for "close"
-                return "ok"
-
-        # Default: No recognized gesture
-        return None
-
-    def detect_wave(self, landmarks) -> bool:
+            records = np.frombuffer(buf, dtype=_LANDMARK_RECORD)
+            points[:, 0] = records["x"]
+            points[:, 1] = records["y"]
+            return points
+
+        # Bind the repeated field once and index it directly
+        landmark_list = landmarks.landmark
+        for i in range(len(landmark_list)):
+            landmark = landmark_list[i]
+            points[i, 0] = landmark.x
+            points[i, 1] = landmark.y
+        return points
+
+    def detect_wave(self, points: np.ndarray, now: Optional[float] = None) -> bool:
         """
         Detect wave gesture based on hand movement patterns.
 
         Args:
-            landmarks: MediaPipe hand landmarks
+            points: float32 (21, 2) array of normalized (x, y) landmarks
+            now: Current time.time() value (looked up if None)
 
         Returns:
             True if wave gesture is detected
         """
-        import time
-
-        if not landmarks:
+        if points is None:
             return False
+        return self._update_wave(points[0, 0], now)
 
-        # Get wrist position (landmark 0) as reference point
-        wrist = landmarks.landmark[0]
-        current_pos = (wrist.x, wrist.y)
-        current_time = time.time()
+    def _update_wave(self, wrist_x: float, now: Optional[float]) -> bool:
+        """
+        Record a wrist x position and check the recent ones for a wave.
+
+        Args:
+            wrist_x: Normalized x coordinate of the wrist (landmark 0)
+            now: Current time.time() value (looked up if None)
+
+        Returns:
+            True if wave gesture is detected
+        """
+        current_time = time.time() if now is None else now
 
         # Prevent rapid wave detections (cooldown)
         if current_time - self.last_wave_time < 2.0:
             return False
 
-        # Store current position
-        self.hand_positions.append(current_pos)
-
-        # Keep only recent positions
-        if len(self.hand_positions) > self.wave_frames:
-            self.hand_positions.pop(0)
+        # Store the wrist x position, overwriting the oldest one
+        i = self._wave_i
+        self._wave_x[i] = wrist_x
+        self._wave_i = (i + 1) % self.wave_frames
+        if self._wave_filled < self.wave_frames:
+            self._wave_filled += 1
 
         # Need enough positions to analyze
-        if len(self.hand_positions) < self.wave_frames:
+        if self._wave_filled < self.wave_frames:
             return False
 
-        # Analyze movement pattern for wave
-        movements = []
-        for i in range(1, len(self.hand_positions)):
-            prev_pos = self.hand_positions[i - 1]
-            curr_pos = self.hand_positions[i]
-
-            # Calculate horizontal movement (x-axis for wave)
-            x_movement = curr_pos[0] - prev_pos[0]
-            movements.append(x_movement)
-
-        # Check for alternating left-right movement pattern
-        direction_changes = 0
-        significant_movements = 0
-
-        for i in range(1, len(movements)):
-            # Count significant movements
-            if abs(movements[i]) > self.wave_threshold:
-                significant_movements += 1
+        # Count significant horizontal (x-axis) movements (ignoring the first)
+        # and direction changes between two significant movements (left-right
+        # or right-left), oldest position first
+        significant_movements, direction_changes = wave_counts(
+            self._wave_x, self._wave_i, self.wave_threshold
+        )
 
-            # Count direction changes (left-right-left or right-left-right)
-            if (
-                movements[i - 1] * movements[i] < 0
-            ):  # Different signs = direction change
-                if (
-                    abs(movements[i - 1]) > self.wave_threshold
-                    and abs(movements[i]) > self.wave_threshold
-                ):
-                    direction_changes += 1
-
-        # Debug logging for wave detection - always show when we have enough frames
-        if len(self.hand_positions) == self.wave_frames:
-            logger = logging.getLogger(__name__)
-            logger.info(
-                f"🌊 Wave analysis: dir_changes={direction_changes}, sig_movements={significant_movements}, movements={movements[:3]}..."
+        # Runs every frame once the buffer is full, so only format when enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            i = self._wave_i
+            movements = np.diff(np.concatenate((self._wave_x[i:], self._wave_x[:i])))
+            logger.debug(
+                "🌊 Wave analysis: dir_changes=%d, sig_movements=%d, movements=%s...",
+                direction_changes,
+                significant_movements,
+                movements[:3],
             )
 
         # Wave detected if we have enough direction changes and movements (even more lenient)
         if direction_changes >= 1 and significant_movements >= 2:
             self.last_wave_time = current_time
-            self.hand_positions = []  # Reset positions after detection
-            logger = logging.getLogger(__name__)
+            self._wave_filled = 0  # Reset positions after detection
             logger.info(
-                f"🌊 Wave detected! dir_changes={direction_changes}, sig_movements={significant_movements}"
+                "🌊 Wave detected! dir_changes=%d, sig_movements=%d",
+                direction_changes,
+                significant_movements,
             )
             return True
 
@@ -437,35 +423,28 @@ class GestureRecognizer:
 
     def _smooth_gesture(self, detected_gesture):
         """Smooth gesture detection to prevent rapid switching between similar gestures."""
-        import time
-
         current_time = time.time()
 
         # Add current gesture to history
         if detected_gesture:
             self.gesture_history.append((detected_gesture, current_time))
 
-        # Keep only recent gestures
+        # Keep only recent gestures (entries are in time order, and the deque
+        # already limits the history size)
         cutoff_time = current_time - 1.0  # Only consider gestures from last 1 second
-        self.gesture_history = [
-            (g, t) for g, t in self.gesture_history if t > cutoff_time
-        ]
-
-        # Limit history size
-        if len(self.gesture_history) > self.gesture_history_size:
-            self.gesture_history = self.gesture_history[-self.gesture_history_size :]
+        history = self.gesture_history
+        while history and history[0][1] <= cutoff_time:
+            history.popleft()
 
-        if not detected_gesture or len(self.gesture_history) < 3:
+        if not detected_gesture or len(history) < 3:
             return detected_gesture
 
-        # Check for rapid switching between similar gestures
-        recent_gestures = [g for g, t in self.gesture_history[-3:]]  # Last 3 gestures
-
-        if len(recent_gestures) >= 3:
+        # Check for rapid switching between similar gestures (last 3 gestures)
+        if len(history) >= 3:
             # Check if we're rapidly switching between similar gestures
-            current = recent_gestures[-1]
-            previous = recent_gestures[-2]
-            before_previous = recent_gestures[-3]
+            current = history[-1][0]
+            previous = history[-2][0]
+            before_previous = history[-3][0]
 
             # If we're switching between similar gestures rapidly, keep the previous gesture
 
@@ -476,41 +455,95 @@ class GestureRecognizer:
             ):
 
                 logger.info(
-                    f"🔄 Smoothing gesture: {current} -> {previous} (preventing rapid switching)"
+                    "🔄 Smoothing gesture: %s -> %s (preventing rapid switching)",
+                    current,
+                    previous,
                 )
                 return previous
 
         return detected_gesture
 
-    def process_frame(self, frame: np.ndarray) -> Tuple[np.ndarray, Optional[str]]:
+    def process_frame(
+        self, frame: np.ndarray, annotate: bool = True
+    ) -> Tuple[np.ndarray, Optional[str]]:
         """
         Process a single frame for gesture recognition.
 
         Args:
-            frame: Input video frame
+            frame: Input video frame (annotated in place)
+            annotate: Draw the hand skeleton and gesture label; pass False
+                when the frame is neither displayed nor streamed
 
         Returns:
             Tuple of (annotated_frame, detected_gesture)
         """
         current_time = time.time()
         detected_gesture = None
+        overlay_only = False
 
-        # Detect hands
-        hand_landmarks = self.detect_hands(frame)
-
-        # Annotate frame with hand landmarks
-        annotated_frame = frame.copy()
+        # Detect hands, unless the scene is unchanged since the last detection
+        gate = cv2.resize(
+            frame, (32, 32), dst=self._gate_buf, interpolation=cv2.INTER_AREA
+        )
+        if (
+            self._gate_ref is not None
+            and time.perf_counter() - self._last_infer_end < self.max_gate_age
+            and cv2.norm(gate, self._gate_ref, cv2.NORM_INF) < self.motion_threshold
+        ):
+            hand_landmarks = self._last_landmarks
+            self._gate_buf = gate
+        elif (
+            self._avg_infer_time > self.target_frame_time
+            and time.perf_counter() - self._last_infer_end < self._avg_infer_time
+        ):
+            # Inference is the bottleneck: redraw the last result on this frame
+            hand_landmarks = self._last_landmarks
+            self._gate_buf = gate
+            overlay_only = True
+        elif (
+            self._no_hand_streak >= self.empty_frames_before_skip
+            and self._no_hand_streak % self.skip_when_empty
+        ):
+            # Hand lost for a while: run palm detection at a reduced rate
+            hand_landmarks = None
+            self._gate_buf = gate
+            self._no_hand_streak += 1
+        else:
+            infer_start = time.perf_counter()
+            hand_landmarks = self.detect_hands(frame)
+            self._last_infer_end = time.perf_counter()
+            infer_time = self._last_infer_end - infer_start
+            if self._avg_infer_time:
+                infer_time = 0.8 * self._avg_infer_time + 0.2 * infer_time
+            self._avg_infer_time = infer_time
+            self._last_landmarks = hand_landmarks
+            self._gate_buf, self._gate_ref = self._gate_ref, gate
+            self._no_hand_streak = 0 if hand_landmarks else self._no_hand_streak + 1
+
+        # Annotate the caller's frame directly rather than a copy
+        annotated_frame = frame
         if hand_landmarks:
-            for landmarks in hand_landmarks:
-                # Draw hand landmarks
-                self.mp_drawing.draw_landmarks(
-                    annotated_frame, landmarks, self.mp_hands.HAND_CONNECTIONS
-                )
-
-                # Classify gesture
-                gesture = self.classify_gesture(landmarks)
+            for points in hand_landmarks:
+                if overlay_only:
+                    # Not a new observation: draw it without classifying again
+                    gesture = self._last_label
+                else:
+                    gesture = self._detect(points, current_time)
+                    self._last_label = gesture
 
-                if gesture:
+                # Draw hand landmarks
+                if annotate:
+                    self._draw_hand(annotated_frame, points)
+
+                if gesture and overlay_only:
+                    # Not a new observation, but a held continuous gesture is
+                    # still held: reporting nothing would end it downstream
+                    if (
+                        gesture in self.continuous_gestures
+                        and gesture == self.last_gesture
+                    ):
+                        detected_gesture = gesture
+                elif gesture:
                     # Apply cooldown to prevent spam, but allow continuous gestures to bypass cooldown
                     is_continuous = gesture in self.continuous_gestures
                     should_detect = (
@@ -524,8 +557,9 @@ class GestureRecognizer:
                         self.last_gesture = gesture
                         self.last_gesture_time = current_time
 
-                        logger.info(f"Detected gesture: {gesture}")
+                        logger.info("Detected gesture: %s", gesture)
 
+                if gesture and annotate:
                     # Draw gesture label on frame
                     cv2.putText(
                         annotated_frame,
@@ -536,7 +570,7 @@ class GestureRecognizer:
                         (0, 255, 0),
                         2,
                     )
-        else:
+        elif annotate:
             # No hands detected
             cv2.putText(
                 annotated_frame,
@@ -550,6 +584,19 @@ class GestureRecognizer:
 
         return annotated_frame, detected_gesture
 
+    def _draw_hand(self, frame: np.ndarray, points: np.ndarray):
+        """
+        Draw the hand skeleton with one polylines call per color.
+
+        Args:
+            frame: Frame to draw on (BGR format)
+            points: (21, 2) normalized landmark coordinates
+        """
+        height, width = frame.shape[:2]
+        pixels = (points * (width, height)).astype(np.int32)
+        cv2.polylines(frame, pixels[self._connections], False, (224, 224, 224), 2)
+        cv2.polylines(frame, pixels[self._joints], False, (0, 0, 255), 6)
+
     def get_supported_gestures(self) -> List[str]:
         """Get list of supported gestures."""
         return [
@@ -592,7 +639,15 @@ class CameraManager:
     Manages webcam input for gesture recognition.
     """
 
-    def __init__(self, camera_index: int = 0, width: int = 640, height: int = 480):
+    def __init__(
+        self,
+        camera_index: int = 0,
+        width: int = 640,
+        height: int = 480,
+        mirror: bool = True,
+        fps: int = 30,
+        fourcc: Optional[str] = "MJPG",
+    ):
         """
         Initialize camera manager.
 
@@ -600,12 +655,32 @@ class CameraManager:
             camera_index: Camera device index (usually 0 for default webcam)
             width: Frame width
             height: Frame height
+            mirror: Flip frames horizontally so they look like a mirror; only
+                needed when someone watches the feed, as the gesture rules
+                do not depend on left-right orientation
+            fps: Requested capture frame rate
+            fourcc: Four-character capture format code (None keeps the
+                driver default); MJPG keeps USB bandwidth low
         """
         self.camera_index = camera_index
         self.width = width
         self.height = height
+        self.mirror = mirror
+        self.fps = fps
+        self.fourcc = fourcc
         self.cap = None
 
+        # A capture thread keeps grabbing so the driver never queues stale
+        # frames, and decodes one into a slot whenever a frame is wanted.
+        # read_frame asks for the next frame as soon as it hands one over, so
+        # grabbing and decoding it overlap with recognition
+        self._latest = None
+        self._lock = threading.Lock()
+        self._frame_event = threading.Event()  # Set when a frame is published
+        self._frame_wanted = threading.Event()  # Set until a frame is decoded
+        self._running = False
+        self._capture_thread = None
+
     def start(self) -> bool:
         """
         Start the camera.
@@ -614,15 +689,40 @@ class CameraManager:
             True if camera started successfully, False otherwise
         """
         try:
-            self.cap = cv2.VideoCapture(self.camera_index)
+            backend = _CAPTURE_BACKENDS.get(platform.system(), cv2.CAP_ANY)
+            self.cap = cv2.VideoCapture(self.camera_index, backend)
+            if not self.cap.isOpened() and backend != cv2.CAP_ANY:
+                self.cap = cv2.VideoCapture(self.camera_index)
             if not self.cap.isOpened():
                 logger.error(f"Failed to open camera {self.camera_index}")
                 return False
 
-            # Set camera properties
+            # Set camera properties. A one-frame driver buffer stops reads
+            # from returning stale frames
+            if self.fourcc:
+                self.cap.set(
+                    cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*self.fourcc)
+                )
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
             self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
             self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
-            self.cap.set(cv2.CAP_PROP_FPS, 30)
+            self.cap.set(cv2.CAP_PROP_FPS, self.fps)
+
+            # Drivers silently fall back to what they support
+            fourcc = int(self.cap.get(cv2.CAP_PROP_FOURCC)) & 0xFFFFFFFF
+            logger.info(
+                "Camera format: %dx%d @ %.0f FPS, %s",
+                self.cap.get(cv2.CAP_PROP_FRAME_WIDTH),
+                self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT),
+                self.cap.get(cv2.CAP_PROP_FPS),
+                fourcc.to_bytes(4, "little").decode("ascii", "replace"),
+            )
+
+            self._running = True
+            self._capture_thread = threading.Thread(
+                target=self._capture_loop, name="camera-capture", daemon=True
+            )
+            self._capture_thread.start()
 
             logger.info(f"Camera {self.camera_index} started successfully")
             return True
@@ -631,26 +731,73 @@ class CameraManager:
             logger.error(f"Error starting camera: {e}")
             return False
 
-    def read_frame(self) -> Optional[np.ndarray]:
+    def _capture_loop(self):
+        """Capture loop that publishes the next frame whenever one is wanted."""
+        while self._running:
+            # grab() keeps the driver queue drained; frames nobody asks for
+            # are never decoded
+            if not self.cap.grab():
+                logger.warning("Failed to read frame from camera")
+                time.sleep(0.1)
+                continue
+            if not self._frame_wanted.is_set():
+                continue
+            self._frame_wanted.clear()
+
+            ret, frame = self.cap.retrieve()
+            if not ret:
+                logger.warning("Failed to decode frame from camera")
+                continue
+
+            # Drivers may ignore the requested size; everything downstream
+            # (recognition, overlays, display, streaming) works at this one
+            if frame.shape[1] != self.width or frame.shape[0] != self.height:
+                frame = cv2.resize(
+                    frame, (self.width, self.height), interpolation=cv2.INTER_AREA
+                )
+
+            # Flip frame horizontally for mirror effect, in place: retrieve()
+            # hands back a fresh array each time, so nothing else sees it
+            if self.mirror:
+                cv2.flip(frame, 1, dst=frame)
+
+            with self._lock:
+                self._latest = frame
+            self._frame_event.set()
+
+    def read_frame(self, timeout: float = 1.0) -> Optional[np.ndarray]:
         """
-        Read a frame from the camera.
+        Return the next frame from the camera.
+
+        Args:
+            timeout: Seconds to wait for a new frame
 
         Returns:
             Frame if successful, None otherwise
         """
-        if not self.cap or not self.cap.isOpened():
+        if not self._running:
             return None
 
-        ret, frame = self.cap.read()
-        if not ret:
-            logger.warning("Failed to read frame from camera")
+        self._frame_wanted.set()
+        if not self._frame_event.wait(timeout):
+            # Nobody is waiting any more; do not decode a frame to go stale
+            self._frame_wanted.clear()
             return None
+        self._frame_event.clear()
+
+        with self._lock:
+            frame, self._latest = self._latest, None
 
-        # Flip frame horizontally for mirror effect
-        return cv2.flip(frame, 1)
+        # Prefetch: decode the next frame while the caller processes this one
+        self._frame_wanted.set()
+        return frame
 
     def stop(self):
         """Stop the camera and release resources."""
+        self._running = False
+        if self._capture_thread:
+            self._capture_thread.join(timeout=1.0)
+            self._capture_thread = None
         if self.cap:
             self.cap.release()
             logger.info("Camera stopped")
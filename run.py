@@ -7,23 +7,29 @@ Author: Gesture Recognition Team Member
 For: BigRedHacks MVP
 
 Usage:
-    python run.py [--camera-index 0] [--use-websocket] [--debug] [--no-display]
+    python run.py [--camera-index 0] [--debug] [--no-display] [--web-stream]
+                  [--hand-model hand_landmarker.task] [--gpu] [--max-fps 30]
+                  [--camera-width 640] [--camera-height 480] [--camera-fps 30]
+                  [--camera-fourcc MJPG] [--detection-width 256]
 """
 
 import argparse
 import cv2
+import numpy as np
 import time
 import signal
 import sys
 import logging
-from typing import Optional
+import logging.handlers
+import platform
+import queue
 import threading
-from datetime import datetime
-import requests
+from typing import Optional
 
 # Import our modules
 from gesture_recognition import GestureRecognizer, CameraManager
-from actions_client import ActionsClient, map_gesture_name
+from _gestures import GESTURE_NAMES
+from actions_client import ActionsClient, create_session, map_gesture_name
 from camera_streamer import initialize_camera_streamer, get_camera_streamer
 
 # Configure logging
@@ -32,18 +38,104 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# pollKey (OpenCV >= 4.5) pumps window events without waitKey's 1 ms sleep
+if hasattr(cv2, "pollKey"):
+    _poll_key = cv2.pollKey
+else:
+
+    def _poll_key():
+        return cv2.waitKey(1)
+
+
+WINDOW_NAME = "Gesture Recognition MVP"
+
+# Status overlay text that never changes
+_OVERLAY_FONT = cv2.FONT_HERSHEY_SIMPLEX
+_GOODBYE_LINES = (
+    "GOODBYE!",
+    "",
+    "Thanks for using",
+    "HandsFree!",
+    "",
+    "Exiting in 3 seconds...",
+)
+
+
+def _goodbye_layout():
+    """Font scale, thickness and width of each goodbye line, skipping blanks."""
+    layout = []
+    for i, line in enumerate(_GOODBYE_LINES):
+        if line:
+            font_scale = 1.2 if i == 0 else 0.8  # Bigger for "GOODBYE!"
+            thickness = 3 if i == 0 else 2  # Bolder for "GOODBYE!"
+            (text_width, _), _ = cv2.getTextSize(
+                line, _OVERLAY_FONT, font_scale, thickness
+            )
+            layout.append((i, line, font_scale, thickness, text_width))
+    return tuple(layout)
+
+
+# The goodbye lines never change, so they are measured once
+_GOODBYE_LAYOUT = _goodbye_layout()
+
+# Available commands (top right corner, compact)
+_COMMANDS = (
+    "Commands:",
+    "Fist→Notify",
+    "Palm→None",
+    "Thumbs→None",
+    "Peace→Reels",
+    "Call→Pause/Resume",
+    "Point→NextSong",
+    "LShape→LinkedIn",
+    "Rock→Spotify",
+    "3Fing→CloseTab",
+    "3FingV2→Notification",
+    "Middle→QUIT",
+    "Ring→None",
+    "Pinky→None",
+    "OK→Play/Pause",
+    "4Fing→None",
+    "Wave→Netflix",
+)
+# Yellow header, red quit command, white for the rest
+_COMMAND_COLORS = tuple(
+    (0, 0, 255) if "QUIT" in command else (0, 255, 255) if i == 0 else (255, 255, 255)
+    for i, command in enumerate(_COMMANDS)
+)
+
+
+def _create_window():
+    """Create the display window, presenting through OpenGL if available."""
+    try:
+        cv2.namedWindow(WINDOW_NAME, cv2.WINDOW_OPENGL | cv2.WINDOW_AUTOSIZE)
+    except cv2.error:
+        # OpenCV was built without OpenGL support
+        cv2.namedWindow(WINDOW_NAME, cv2.WINDOW_AUTOSIZE)
+
 
 class GestureRecognitionApp:
     """
     Main application class that orchestrates all components.
     """
 
+    # Gestures that are tracked as started/held/ended rather than one-shot
+    CONTINUOUS_GESTURES = frozenset({"thumbs_up", "thumbs_down"})
+
     def __init__(
         self,
         camera_index: int = 0,
         show_display: bool = True,
         debug: bool = False,
         web_stream: bool = False,
+        hand_model: Optional[str] = None,
+        use_gpu: bool = False,
+        max_fps: Optional[float] = None,
+        camera_width: int = 640,
+        camera_height: int = 480,
+        camera_fps: int = 30,
+        camera_fourcc: Optional[str] = "MJPG",
+        detection_width: Optional[int] = 256,
     ):
         """
         Initialize the gesture recognition application.
@@ -52,6 +144,17 @@ class GestureRecognitionApp:
             camera_index: Camera device index
             show_display: Show camera feed window
             debug: Enable debug logging
+            hand_model: Path to a MediaPipe hand_landmarker.task bundle
+                (uses the Tasks API instead of the legacy Hands solution)
+            use_gpu: Run the hand landmarker on the GPU delegate
+            max_fps: Cap on frames processed per second (None for no cap;
+                the loop otherwise runs at the camera's frame rate)
+            camera_width: Requested capture width
+            camera_height: Requested capture height
+            camera_fps: Requested capture frame rate
+            camera_fourcc: Capture format code (None keeps the driver default)
+            detection_width: Width frames are shrunk to before hand detection
+                (None for full resolution)
         """
         if debug:
             logging.getLogger().setLevel(logging.DEBUG)
@@ -59,18 +162,43 @@ class GestureRecognitionApp:
         self.camera_index = camera_index
         self.show_display = show_display
         self.web_stream = web_stream
+        self.max_fps = max_fps
         self.running = False
+        self._stopped = True  # Nothing to clean up until start() succeeds
 
         # Initialize components
-        self.camera = CameraManager(camera_index=camera_index)
-        self.recognizer = GestureRecognizer()
-        self.actions_client = ActionsClient()
+        # Frames are only mirrored when someone sees them
+        self.camera = CameraManager(
+            camera_index=camera_index,
+            width=camera_width,
+            height=camera_height,
+            mirror=show_display or web_stream,
+            fps=camera_fps,
+            fourcc=camera_fourcc,
+        )
+        # Likewise, only draw hands and labels on frames that are shown
+        self._annotate = show_display or web_stream
+        self.recognizer = GestureRecognizer(
+            model_asset_path=hand_model,
+            use_gpu=use_gpu,
+            detection_width=detection_width,
+        )
+
+        # One keep-alive session shared by gesture and frame traffic
+        self.http_session = create_session()
+        # A held gesture is reported on every frame; the client coalesces
+        # identical (gesture, state) sends within dedupe_window seconds
+        self.actions_client = ActionsClient(
+            dedupe_window=0.5, session=self.http_session
+        )
 
         # Initialize camera streamer for web frontend (only if web streaming is enabled)
         self.camera_streamer = None
         if web_stream:
             self.camera_streamer = initialize_camera_streamer(
-                camera_index=camera_index, server_url="http://localhost:3001"
+                camera_index=camera_index,
+                server_url="http://localhost:3001",
+                session=self.http_session,
             )
 
         # Statistics
@@ -79,6 +207,10 @@ class GestureRecognitionApp:
         self.start_time = None
         self.camera_paused = False
 
+        # Frame rate shown in the overlay: EWMA over roughly the last 10 frames
+        self._last_tick = None  # time.monotonic_ns() of the previous frame
+        self._ewma_fps = 0.0
+
         # Gesture cooldown tracking
         self.last_gesture_time = {}
         self.gesture_cooldown = 2.0  # 2 seconds cooldown between same gestures
@@ -96,22 +228,44 @@ class GestureRecognitionApp:
             0.3  # Seconds to wait before changing gesture state
         )
 
+        # Action server name for every label the recognizer can produce
+        self._gesture_lut = {
+            gesture: map_gesture_name(gesture) for gesture in GESTURE_NAMES + ("wave",)
+        }
+
+        # Status overlay, rendered at most every overlay_refresh seconds (or
+        # when what it shows changes) and blitted onto each displayed frame
+        self.overlay_refresh = 0.5
+        self._overlay_cache = None  # (flat indices, values) of the text pixels
+        self._overlay_key = None
+        self._overlay_ts = 0.0
+
+        # Display thread (not on macOS, where HighGUI must stay on the main
+        # thread); frames are handed over through a one-slot queue
+        self._display_queue = None
+        self._display_thread = None
+        self._quit_requested = False
+
         # Exit message tracking
         self.showing_exit_message = False
         self.exit_message_start_time = None
         self.exit_initiated = False  # Flag to prevent actions after exit is initiated
 
-        logger.info(f"GestureRecognitionApp initialized")
-        logger.info(f"  Camera: {camera_index}")
-        logger.info(f"  Communication: HTTP")
-        logger.info(f"  Display: {'Enabled' if show_display else 'Disabled'}")
+        logger.info(
+            "GestureRecognitionApp initialized\n  Camera: %s\n  Communication: HTTP"
+            "\n  Display: %s",
+            camera_index,
+            "Enabled" if show_display else "Disabled",
+        )
 
     def setup_signal_handlers(self):
         """Setup signal handlers for graceful shutdown."""
 
         def signal_handler(signum, frame):
-            logger.info(f"Received signal {signum}, shutting down gracefully...")
-            self.stop()
+            # Only ask the main loop to finish; it cleans up via stop() once
+            # the current frame is done instead of in the middle of it
+            logger.info("Received signal %d, shutting down gracefully...", signum)
+            self.running = False
 
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGTERM, signal_handler)
@@ -125,8 +279,10 @@ class GestureRecognitionApp:
         """
         logger.info("Starting Gesture Recognition MVP...")
 
-        # Test action server connection
-        if not self.actions_client.test_connection():
+        # Fetch the gesture mappings; this also verifies the action server is
+        # reachable and opens the keep-alive connection gestures will reuse
+        mappings = self.actions_client.get_available_gestures()
+        if mappings is None:
             logger.error("❌ Cannot connect to action server!")
             logger.error("Make sure the action server is running:")
             logger.error("  cd /path/to/BigRedHacks")
@@ -134,11 +290,8 @@ class GestureRecognitionApp:
             return False
 
         logger.info("✅ Action server connection verified")
-
-        # Get available gesture mappings
-        mappings = self.actions_client.get_available_gestures()
         if mappings:
-            logger.info(f"📋 Available actions: {list(mappings.keys())}")
+            logger.info("📋 Available actions: %s", list(mappings))
 
         # Start camera
         if not self.camera.start():
@@ -157,8 +310,19 @@ class GestureRecognitionApp:
         logger.info(f"🤚 Supported gestures: {supported_gestures}")
 
         self.running = True
+        self._stopped = False
         self.start_time = time.time()
 
+        if self.show_display and not self.web_stream:
+            if platform.system() != "Darwin":
+                self._display_queue = queue.Queue(maxsize=1)
+                self._display_thread = threading.Thread(
+                    target=self._display_loop, name="display", daemon=True
+                )
+                self._display_thread.start()
+            else:
+                _create_window()
+
         logger.info("🚀 Gesture Recognition MVP is running!")
         logger.info("Press 'q' to quit or Ctrl+C for graceful shutdown")
 
@@ -179,16 +343,32 @@ class GestureRecognitionApp:
 
         self.frames_processed += 1
 
+        now_ns = time.monotonic_ns()
+        if self._last_tick is not None and now_ns > self._last_tick:
+            fps = 1e9 / (now_ns - self._last_tick)
+            if self._ewma_fps:
+                fps = 0.9 * self._ewma_fps + 0.1 * fps
+            self._ewma_fps = fps
+        self._last_tick = now_ns
+
         # Process frame for gesture recognition
-        annotated_frame, detected_gesture = self.recognizer.process_frame(frame)
+        annotated_frame, detected_gesture = self.recognizer.process_frame(
+            frame, annotate=self._annotate
+        )
 
-        # Update camera streamer with current frame (if enabled)
+        # Update camera streamer with current frame (if enabled). Each frame
+        # is a fresh array from the camera and the local display is off while
+        # streaming, so nothing draws on it afterwards and no copy is needed
         if self.camera_streamer:
-            self.camera_streamer.update_frame(annotated_frame, detected_gesture)
+            self.camera_streamer.update_frame(
+                annotated_frame, detected_gesture, copy=False
+            )
+
+        # One wall-clock reading serves all of this frame's gesture bookkeeping
+        current_time = time.time()
 
         # Check if we should exit after showing goodbye message
         if self.showing_exit_message and self.exit_message_start_time:
-            current_time = time.time()
             time_since_message = current_time - self.exit_message_start_time
             remaining_time = 3.0 - time_since_message
 
@@ -203,19 +383,18 @@ class GestureRecognitionApp:
                 return False
 
         # Handle gesture state changes for continuous gestures
-        gesture_state = self._determine_gesture_state(detected_gesture)
+        gesture_state = self._determine_gesture_state(detected_gesture, current_time)
 
         # Handle detected gesture
         if detected_gesture:
             # Skip all actions if exit has been initiated
             if self.exit_initiated:
                 logger.info(
-                    f"⏹️ Gesture '{detected_gesture}' detected but exit initiated - ignoring"
+                    "⏹️ Gesture '%s' detected but exit initiated - ignoring",
+                    detected_gesture,
                 )
                 return True  # Continue processing but don't execute any actions
 
-            current_time = time.time()
-
             # Check for middle finger gesture to quit
 
             if detected_gesture == "middle_finger":
@@ -232,13 +411,7 @@ class GestureRecognitionApp:
                     self.exit_message_start_time = current_time
                     self.exit_initiated = True  # Prevent any further actions
                 logger.info("Middle finger gesture detected - closing application")
-                try:
-                    requests.post(
-                        "http://localhost:3001/api/python-status",
-                        json={"status": "stopped"},
-                    )
-                except Exception as e:
-                    logger.warning(f"Could not notify backend to stop Python: {e}")
+                self.actions_client.report_python_status("stopped")
                 return True  # Continue processing to show the message
 
             # Check for call gesture to pause/unpause camera
@@ -253,7 +426,7 @@ class GestureRecognitionApp:
             # Skip sending other gestures to action server if camera is paused
             if self.camera_paused:
                 logger.info(
-                    f"⏸️ Gesture '{detected_gesture}' detected but actions are paused"
+                    "⏸️ Gesture '%s' detected but actions are paused", detected_gesture
                 )
                 return True  # Continue processing
 
@@ -266,10 +439,12 @@ class GestureRecognitionApp:
                         self.last_detected_gesture
                         and self.last_detected_gesture in self.active_gestures
                     ):
-                        self._stop_continuous_gesture(self.last_detected_gesture)
+                        self._stop_continuous_gesture(
+                            self.last_detected_gesture, current_time
+                        )
 
                 # Start new continuous gesture
-                self._start_continuous_gesture(detected_gesture)
+                self._start_continuous_gesture(detected_gesture, current_time)
 
             elif gesture_state == "ended":
                 # Gesture no longer detected
@@ -277,21 +452,21 @@ class GestureRecognitionApp:
                     self.last_detected_gesture
                     and self.last_detected_gesture in self.active_gestures
                 ):
-                    self._stop_continuous_gesture(self.last_detected_gesture)
+                    self._stop_continuous_gesture(
+                        self.last_detected_gesture, current_time
+                    )
 
             elif gesture_state == "detected":
                 # Regular single-action gesture (not continuous)
-                self._handle_single_gesture(detected_gesture)
+                self._handle_single_gesture(detected_gesture, current_time)
 
             # Map gesture name for action server
-            mapped_gesture = map_gesture_name(detected_gesture)
+            mapped_gesture = self._gesture_lut.get(
+                detected_gesture
+            ) or map_gesture_name(detected_gesture)
 
-            # Send to action server (non-blocking)
-            threading.Thread(
-                target=self._send_gesture_async,
-                args=(mapped_gesture, gesture_state),
-                daemon=True,
-            ).start()
+            # Send to action server (queued, never blocks)
+            self._send_gesture(mapped_gesture, gesture_state)
 
         # Handle case where no gesture is detected but we need to end a continuous gesture
         elif (
@@ -300,71 +475,125 @@ class GestureRecognitionApp:
             and self.last_detected_gesture in self.active_gestures
         ):
             # Map gesture name for action server
-            mapped_gesture = map_gesture_name(self.last_detected_gesture)
+            mapped_gesture = self._gesture_lut.get(
+                self.last_detected_gesture
+            ) or map_gesture_name(self.last_detected_gesture)
 
             # Stop the continuous gesture
-            self._stop_continuous_gesture(self.last_detected_gesture)
+            self._stop_continuous_gesture(self.last_detected_gesture, current_time)
 
-            # Send "ended" state to action server (non-blocking)
-            threading.Thread(
-                target=self._send_gesture_async,
-                args=(mapped_gesture, gesture_state),
-                daemon=True,
-            ).start()
+            # Send "ended" state to action server (queued, never blocks)
+            self._send_gesture(mapped_gesture, gesture_state)
 
         # Display frame if enabled (hide OpenCV window when streaming to web)
         if self.show_display and not self.web_stream:
             # Add status information to frame
             self._add_status_overlay(annotated_frame)
 
-            cv2.imshow("Gesture Recognition MVP", annotated_frame)
+            if self._display_queue is not None:
+                self._show_frame(annotated_frame)
+                quit_pressed = self._quit_requested
+            else:
+                cv2.imshow(WINDOW_NAME, annotated_frame)
+                quit_pressed = _poll_key() & 0xFF == ord("q")
 
             # Check for quit key
-            key = cv2.waitKey(1) & 0xFF
-            if key == ord("q"):
+            if quit_pressed:
                 logger.info("Quit key pressed")
                 return False
 
         return True
 
-    def _send_gesture_async(self, gesture: str, gesture_state: str = "detected"):
-        """Send gesture to action server asynchronously."""
+    def _show_frame(self, frame):
+        """
+        Hand a frame to the display thread, replacing one not yet shown.
+
+        Args:
+            frame: Annotated frame; it must not be modified afterwards
+        """
+        try:
+            self._display_queue.put_nowait(frame)
+        except queue.Full:
+            try:
+                self._display_queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._display_queue.put_nowait(frame)
+
+    def _display_loop(self):
+        """Show frames and poll the quit key off the recognition thread."""
+        # The window belongs to the thread that shows it
+        _create_window()
+        while self.running:
+            try:
+                frame = self._display_queue.get(timeout=0.1)
+                cv2.imshow(WINDOW_NAME, frame)
+            except queue.Empty:
+                pass
+
+            # Also keeps the window responsive while no frames arrive
+            if _poll_key() & 0xFF == ord("q"):
+                self._quit_requested = True
+
+        cv2.destroyAllWindows()
+
+    def _send_gesture(self, gesture: str, gesture_state: str = "detected"):
+        """
+        Hand a gesture to the action server client.
+
+        ActionsClient.send_gesture only enqueues the message for its own
+        flush thread (and coalesces repeats), so this is safe to call from
+        the frame loop.
+        """
         try:
             success = self.actions_client.send_gesture(
                 gesture, gesture_state=gesture_state
             )
             if success:
-                logger.info(
-                    f"✅ Gesture '{gesture}' ({gesture_state}) sent to action server"
+                # Also true for coalesced repeats, i.e. every frame of a hold
+                logger.debug(
+                    "✅ Gesture '%s' (%s) queued for action server",
+                    gesture,
+                    gesture_state,
                 )
             else:
                 logger.warning(
-                    f"❌ Failed to send gesture '{gesture}' ({gesture_state})"
+                    "❌ Failed to send gesture '%s' (%s)", gesture, gesture_state
                 )
         except Exception as e:
-            logger.error(f"Error sending gesture '{gesture}' ({gesture_state}): {e}")
+            logger.error(
+                "Error sending gesture '%s' (%s): %s", gesture, gesture_state, e
+            )
 
-    def _determine_gesture_state(self, detected_gesture):
+    def _determine_gesture_state(self, detected_gesture, current_time: float):
         """Determine the state of the detected gesture for continuous tracking."""
-        import time
-
-        current_time = time.time()
-
-        # Define which gestures should be treated as continuous
-        continuous_gestures = {"thumbs_up", "thumbs_down"}
 
-        logger.info(
-            f"🔍 Determining gesture state for: '{detected_gesture}' (last: '{self.last_detected_gesture}', active: {list(self.active_gestures.keys())})"
-        )
-        logger.info(
-            f"🔍 Gesture state debug - detected: '{detected_gesture}', last: '{self.last_detected_gesture}', in_continuous: {detected_gesture in continuous_gestures if detected_gesture else 'N/A'}"
-        )
+        # State tracing runs on every frame, so it is DEBUG only, and the
+        # arguments are only built when that is enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "🔍 Determining gesture state for: '%s' (last: '%s', active: %s)",
+                detected_gesture,
+                self.last_detected_gesture,
+                list(self.active_gestures),
+            )
+            logger.debug(
+                "🔍 Gesture state debug - detected: '%s', last: '%s', "
+                "in_continuous: %s",
+                detected_gesture,
+                self.last_detected_gesture,
+                (
+                    detected_gesture in self.CONTINUOUS_GESTURES
+                    if detected_gesture
+                    else "N/A"
+                ),
+            )
 
         if not detected_gesture:
             # No gesture detected - check if we need to end a continuous gesture
             if (
                 self.last_detected_gesture
-                and self.last_detected_gesture in continuous_gestures
+                and self.last_detected_gesture in self.CONTINUOUS_GESTURES
             ):
                 # Add cooldown to prevent rapid ending of continuous gestures
                 gesture_key = f"{self.last_detected_gesture}_ended"
@@ -373,66 +602,67 @@ class GestureRecognitionApp:
                     or current_time - self.gesture_state_cooldown[gesture_key]
                     > self.gesture_state_cooldown_time
                 ):
-                    logger.info(
-                        f"🔄 No gesture detected, ending continuous gesture: {self.last_detected_gesture}"
+                    logger.debug(
+                        "🔄 No gesture detected, ending continuous gesture: %s",
+                        self.last_detected_gesture,
                     )
                     self.gesture_state_cooldown[gesture_key] = current_time
                     return "ended"
                 else:
-                    logger.info(
-                        f"⏳ Cooldown active for ending gesture: {self.last_detected_gesture}"
+                    logger.debug(
+                        "⏳ Cooldown active for ending gesture: %s",
+                        self.last_detected_gesture,
                     )
                     return None
             return None
 
         # Check if this is a continuous gesture
-        if detected_gesture in continuous_gestures:
+        if detected_gesture in self.CONTINUOUS_GESTURES:
             if detected_gesture in self.active_gestures:
                 # Continuing to hold the same continuous gesture
-                logger.info(
-                    f"⏸️ Continuing to hold continuous gesture: {detected_gesture}"
+                logger.debug(
+                    "⏸️ Continuing to hold continuous gesture: %s", detected_gesture
                 )
                 return "held"
             elif detected_gesture != self.last_detected_gesture:
                 # New continuous gesture detected
-                logger.info(f"🆕 New continuous gesture detected: {detected_gesture}")
+                logger.debug("🆕 New continuous gesture detected: %s", detected_gesture)
                 return "started"
             else:
                 # Same gesture detected but not in active_gestures - treat as started
-                logger.info(
-                    f"🎬 Same continuous gesture detected again: {detected_gesture}"
+                logger.debug(
+                    "🎬 Same continuous gesture detected again: %s", detected_gesture
                 )
                 return "started"
 
         # Regular single-action gesture
-        logger.info(f"👆 Regular single-action gesture: {detected_gesture}")
+        logger.debug("👆 Regular single-action gesture: %s", detected_gesture)
         return "detected"
 
-    def _start_continuous_gesture(self, gesture: str):
+    def _start_continuous_gesture(self, gesture: str, now: float):
         """Start tracking a continuous gesture."""
-        self.active_gestures[gesture] = {"start_time": time.time(), "frames_held": 0}
+        self.active_gestures[gesture] = {"start_time": now, "frames_held": 0}
         self.last_detected_gesture = gesture
-        logger.info(f"🔄 Started continuous gesture: {gesture}")
+        logger.debug("🔄 Started continuous gesture: %s", gesture)
 
-    def _stop_continuous_gesture(self, gesture: str):
+    def _stop_continuous_gesture(self, gesture: str, now: float):
         """Stop tracking a continuous gesture."""
         if gesture in self.active_gestures:
-            duration = time.time() - self.active_gestures[gesture]["start_time"]
+            duration = now - self.active_gestures[gesture]["start_time"]
             del self.active_gestures[gesture]
-            logger.info(
-                f"⏹️ Stopped continuous gesture: {gesture} (held for {duration:.1f}s)"
+            logger.debug(
+                "⏹️ Stopped continuous gesture: %s (held for %.1fs)", gesture, duration
             )
 
         # Track when gesture ended for potential restart detection
-        self.last_gesture_end_time = time.time()
+        self.last_gesture_end_time = now
 
         # Clear last detected gesture if it's the same as the one we're stopping
         if self.last_detected_gesture == gesture:
             self.last_detected_gesture = None
 
-    def _handle_single_gesture(self, gesture: str):
+    def _handle_single_gesture(self, gesture: str, current_time: float):
         """Handle a single-action gesture with cooldown."""
-        current_time = time.time()
 
         # Check cooldown for this gesture
         if gesture in self.last_gesture_time:
@@ -445,100 +675,84 @@ class GestureRecognitionApp:
 
             if time_since_last < cooldown_time:
                 logger.info(
-                    f"⏳ Gesture '{gesture}' in cooldown ({cooldown_time - time_since_last:.1f}s remaining)"
+                    "⏳ Gesture '%s' in cooldown (%.1fs remaining)",
+                    gesture,
+                    cooldown_time - time_since_last,
                 )
                 return
 
         # Update last gesture time
         self.last_gesture_time[gesture] = current_time
         self.gestures_detected += 1
-        logger.info(f"🤚 Single gesture detected: {gesture}")
+        logger.info("🤚 Single gesture detected: %s", gesture)
 
     def _add_status_overlay(self, frame):
         """Add status information overlay to the frame."""
-        height, width = frame.shape[:2]
+        now = time.monotonic()
+        key = (frame.shape, self.showing_exit_message, self.camera_paused)
+        if (
+            self._overlay_cache is None
+            or key != self._overlay_key
+            or now - self._overlay_ts > self.overlay_refresh
+        ):
+            self._overlay_cache = self._render_status_overlay(frame.shape)
+            self._overlay_key = key
+            self._overlay_ts = now
 
-        # Calculate FPS
-        if self.start_time and self.frames_processed > 0:
-            elapsed = time.time() - self.start_time
-            fps = self.frames_processed / elapsed
-        else:
-            fps = 0
+        # Write only the rendered text pixels into the frame
+        indices, values = self._overlay_cache
+        frame.put(indices, values)
+
+    def _render_status_overlay(self, shape):
+        """
+        Render the status and commands overlays.
+
+        Args:
+            shape: Shape of the frames the overlay is drawn on
+
+        Returns:
+            Tuple of (flat indices, values) of the text pixels, for ndarray.put
+        """
+        height, width = shape[:2]
+        layer = np.zeros(shape, dtype=np.uint8)
 
         # Status text (left side)
-        if self.showing_exit_message:
-            status_lines = [
-                "GOODBYE!",
-                "",
-                "Thanks for using",
-                "HandsFree!",
-                "",
-                "Exiting in 3 seconds...",
-            ]
-        else:
-            status_lines = [
+        if not self.showing_exit_message:
+            status_lines = (
                 "🤚 Gesture Recognition MVP",
-                f"FPS: {fps:.1f}",
+                f"FPS: {self._ewma_fps:.1f}",
                 f"Frames: {self.frames_processed}",
                 f"Gestures: {self.gestures_detected}",
                 "Mode: HTTP",
                 f"Camera: {'PAUSED' if self.camera_paused else 'ACTIVE'}",
                 "Press 'q' or middle finger gesture to quit",
-            ]
-
-        # Available commands (top right corner, compact)
-        commands = [
-            "Commands:",
-            "Fist→Notify",
-            "Palm→None",
-            "Thumbs→None",
-            "Peace→Reels",
-            "Call→Pause/Resume",
-            "Point→NextSong",
-            "LShape→LinkedIn",
-            "Rock→Spotify",
-            "3Fing→CloseTab",
-            "3FingV2→Notification",
-            "Middle→QUIT",
-            "Ring→None",
-            "Pinky→None",
-            "OK→Play/Pause",
-            "4Fing→None",
-            "Wave→Netflix",
-        ]
+            )
 
         # Draw status overlay
         if self.showing_exit_message:
             # Center the goodbye message with bigger, bold, blue text
             y_start = height // 2 - 60  # Center vertically
-            for i, line in enumerate(status_lines):
-                if line:  # Skip empty lines
-                    # Calculate text size for centering
-                    font_scale = 1.2 if i == 0 else 0.8  # Bigger for "GOODBYE!"
-                    thickness = 3 if i == 0 else 2  # Bolder for "GOODBYE!"
-                    (text_width, text_height), _ = cv2.getTextSize(
-                        line, cv2.FONT_HERSHEY_SIMPLEX, font_scale, thickness
-                    )
-                    x_center = (width - text_width) // 2  # Center horizontally
-
-                    cv2.putText(
-                        frame,
-                        line,
-                        (x_center, y_start + i * 40),
-                        cv2.FONT_HERSHEY_SIMPLEX,
-                        font_scale,
-                        (255, 0, 0),  # Blue color
-                        thickness,
-                    )
+            for i, line, font_scale, thickness, text_width in _GOODBYE_LAYOUT:
+                x_center = (width - text_width) // 2  # Center horizontally
+
+                cv2.putText(
+                    layer,
+                    line,
+                    (x_center, y_start + i * 40),
+                    _OVERLAY_FONT,
+                    font_scale,
+                    (255, 0, 0),  # Blue color
+                    thickness,
+                )
         else:
             # Normal status display (left side, moved down)
             y_offset = height - 180  # Position near bottom of frame
             for line in status_lines:
                 cv2.putText(
-                    frame,
+                    layer,
                     line,
                     (10, y_offset),
-                    cv2.FONT_HERSHEY_SIMPLEX,
+                    _OVERLAY_FONT,
                     0.5,
                     (0, 255, 0),  # Green color
                     1,
@@ -548,33 +762,44 @@ class GestureRecognitionApp:
         # Draw commands overlay (top right corner, very small)
         x_offset = width - 180  # Position in top right corner
         y_offset = 15
-        for i, command in enumerate(commands):
-            color = (255, 255, 255)  # White
-            if "QUIT" in command:
-                color = (0, 0, 255)  # Red for quit command
-            elif i == 0:  # Header
-                color = (0, 255, 255)  # Yellow for header
-
+        for command, color in zip(_COMMANDS, _COMMAND_COLORS):
             cv2.putText(
-                frame,
+                layer,
                 command,
                 (x_offset, y_offset),
-                cv2.FONT_HERSHEY_SIMPLEX,
+                _OVERLAY_FONT,
                 0.25,  # Much smaller text
                 color,
                 1,
             )
             y_offset += 12  # Smaller line spacing
 
+        # putText draws aliased (LINE_8) text in non-black colors, so exactly
+        # the drawn pixels are non-zero and can be copied as-is
+        pixels = layer.reshape(-1, layer.shape[2])
+        drawn = np.flatnonzero(pixels.any(axis=1))
+        indices = (drawn[:, None] * layer.shape[2] + np.arange(layer.shape[2])).ravel()
+        return indices, pixels[drawn].ravel()
+
     def run(self):
         """Main application loop."""
+        # read_frame blocks until the camera delivers a new frame, so the loop
+        # only needs an explicit throttle when asked for one
+        frame_interval = 1.0 / self.max_fps if self.max_fps else 0.0
+
+        # Bound once; the loop runs for every frame
+        process_frame = self.process_frame
+        monotonic = time.monotonic
         try:
             while self.running:
-                if not self.process_frame():
+                frame_start = monotonic()
+                if not process_frame():
                     break
 
-                # Small delay to prevent excessive CPU usage
-                time.sleep(0.01)
+                if frame_interval:
+                    remaining = frame_interval - (monotonic() - frame_start)
+                    if remaining > 0:
+                        time.sleep(remaining)
 
         except Exception as e:
             logger.error(f"Unexpected error in main loop: {e}")
@@ -584,26 +809,26 @@ class GestureRecognitionApp:
 
     def stop(self):
         """Stop the application and clean up resources."""
-        if not self.running:
+        if self._stopped:
             return
+        self._stopped = True
 
         logger.info("Stopping Gesture Recognition MVP...")
         self.running = False
 
-        # Show final statistics
+        # Show final statistics, including the actions client's, as one record
+        lines = ["📊 Session Statistics:"]
         if self.start_time:
             elapsed = time.time() - self.start_time
-            logger.info(f"📊 Session Statistics:")
-            logger.info(f"  Runtime: {elapsed:.1f} seconds")
-            logger.info(f"  Frames processed: {self.frames_processed}")
-            logger.info(f"  Gestures detected: {self.gestures_detected}")
+            lines.append(f"  Runtime: {elapsed:.1f} seconds")
+            lines.append(f"  Frames processed: {self.frames_processed}")
+            lines.append(f"  Gestures detected: {self.gestures_detected}")
             if self.frames_processed > 0:
-                logger.info(f"  Average FPS: {self.frames_processed / elapsed:.1f}")
-
-        # Show actions client statistics
+                lines.append(f"  Average FPS: {self.frames_processed / elapsed:.1f}")
         stats = self.actions_client.get_statistics()
-        logger.info(f"  Actions sent: {stats['gestures_sent']}")
-        logger.info(f"  Success rate: {stats['success_rate']:.1f}%")
+        lines.append(f"  Actions sent: {stats['gestures_sent']}")
+        lines.append(f"  Success rate: {stats['success_rate']:.1f}%")
+        logger.info("\n".join(lines))
 
         # Cleanup resources
         self.camera.stop()
@@ -611,13 +836,37 @@ class GestureRecognitionApp:
         self.actions_client.cleanup()
         if self.camera_streamer:
             self.camera_streamer.stop_camera()
+        self.http_session.close()
 
-        if self.show_display:
+        if self._display_thread is not None:
+            # The display thread closes its own windows on the way out
+            self._display_thread.join(timeout=1.0)
+        elif self.show_display:
             cv2.destroyAllWindows()
 
         logger.info("✅ Cleanup completed")
 
 
+def _log_in_background() -> logging.handlers.QueueListener:
+    """
+    Move log output off the threads that log.
+
+    The root handlers are swapped for a QueueHandler, and a listener thread
+    passes the records on to the original handlers.
+
+    Returns:
+        The started listener; stop() it to flush the remaining records
+    """
+    root = logging.getLogger()
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, *root.handlers, respect_handler_level=True
+    )
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    listener.start()
+    return listener
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description="Gesture Recognition MVP")
@@ -635,15 +884,77 @@ def main():
         action="store_true",
         help="Stream camera feed to web frontend instead of showing OpenCV window",
     )
+    parser.add_argument(
+        "--hand-model",
+        help="MediaPipe hand_landmarker.task bundle (enables the Tasks API)",
+    )
+    parser.add_argument(
+        "--gpu",
+        action="store_true",
+        help="Run the hand landmarker on the GPU (requires --hand-model)",
+    )
+    parser.add_argument(
+        "--max-fps",
+        type=float,
+        help="Limit how many frames are processed per second (default: no limit)",
+    )
+    parser.add_argument(
+        "--camera-width", type=int, default=640, help="Capture width (default: 640)"
+    )
+    parser.add_argument(
+        "--camera-height", type=int, default=480, help="Capture height (default: 480)"
+    )
+    parser.add_argument(
+        "--camera-fps", type=int, default=30, help="Capture frame rate (default: 30)"
+    )
+    parser.add_argument(
+        "--camera-fourcc",
+        default="MJPG",
+        help="Capture format, or 'none' for the driver default (default: MJPG)",
+    )
+    parser.add_argument(
+        "--detection-width",
+        type=int,
+        default=256,
+        help="Width frames are shrunk to for hand detection, or 0 for full "
+        "resolution (default: 256)",
+    )
 
     args = parser.parse_args()
+    if args.camera_fourcc.lower() != "none" and len(args.camera_fourcc) != 4:
+        parser.error("--camera-fourcc must be four characters or 'none'")
+
+    # Write log output from a background thread instead of the frame loop
+    log_listener = _log_in_background()
+    try:
+        _run_app(args)
+    finally:
+        log_listener.stop()
+
 
+def _run_app(args: argparse.Namespace):
+    """
+    Create, start and run the application.
+
+    Args:
+        args: Parsed command line arguments
+    """
     # Create and configure application
     app = GestureRecognitionApp(
         camera_index=args.camera_index,
         show_display=not args.no_display,
         debug=args.debug,
         web_stream=args.web_stream,
+        hand_model=args.hand_model,
+        use_gpu=args.gpu,
+        max_fps=args.max_fps,
+        camera_width=args.camera_width,
+        camera_height=args.camera_height,
+        camera_fps=args.camera_fps,
+        camera_fourcc=None
+        if args.camera_fourcc.lower() == "none"
+        else args.camera_fourcc,
+        detection_width=args.detection_width or None,
     )
 
     # Setup signal handlers for graceful shutdown
@@ -660,7 +971,7 @@ def main():
     except KeyboardInterrupt:
         logger.info("Received keyboard interrupt")
     except Exception as e:
-        logger.error(f"Unexpected error: {e}")
+        logger.error("Unexpected error: %s", e)
         sys.exit(1)
 
     logger.info("🎉 Gesture Recognition MVP stopped successfully")
@@ -1277,27 +1277,45 @@ class GestureRecognitionMCPServer {
       }
     });
 
-    // Camera streaming endpoint
-    app.post("/api/camera-frame", (req, res) => {
-      const { image, timestamp, gesture } = req.body;
+    // Batched gesture events queued by the Python client while a request was in flight
+    app.post("/api/detect-gesture/batch", async (req, res) => {
+      const { events = [] } = req.body;
+      let failed = 0;
+
+      // Perform in order so started/ended transitions stay consistent
+      for (const { gesture, timestamp, gestureState = 'detected' } of events) {
+        try {
+          await this.performAction({ gesture, timestamp, gestureState });
+        } catch (error) {
+          failed += 1;
+          console.error(`Batched gesture ${gesture} failed:`, error.message);
+        }
+      }
+
+      res.json({ success: failed === 0, processed: events.length, failed });
+    });
+
+    // Camera streaming endpoint (raw JPEG body, metadata in headers)
+    const rawJpeg = express.raw({ type: "image/jpeg", limit: "5mb" });
+    app.post("/api/camera-frame", rawJpeg, (req, res) => {
+      const timestamp = Number(req.get("X-Timestamp")) || Date.now() / 1000;
+      const gesture = req.get("X-Gesture") || null;
 
-      // Store the latest frame data
+      // Store the latest frame data; base64 is only produced when it is read
       this.latestFrame = {
-        image,
+        jpeg: req.body,
         timestamp,
         gesture,
       };
 
-      // Log camera frame received
-      console.log(`Camera frame received with gesture: ${gesture || "none"}`);
-
       res.json({ success: true });
     });
 
     // Get latest camera frame
     app.get("/api/camera-frame", (req, res) => {
       if (this.latestFrame) {
-        res.json(this.latestFrame);
+        const { jpeg, timestamp, gesture } = this.latestFrame;
+        res.json({ image: jpeg.toString("base64"), timestamp, gesture });
       } else {
         res.status(404).json({ error: "No camera frame available" });
       }